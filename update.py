@@ -4,13 +4,35 @@
 
 import os
 import sys
+import bisect
+import copy
 import json
-import subprocess
-import hashlib
+import mmap
+import functools
+import re
 import shutil
+import stat
+import struct
+import sysconfig
+import threading
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- Configuration ---
 REMOTE_URL = "https://github.com/secvulnhub/SecV.git"
@@ -20,15 +42,69 @@ CACHE_DIR = SECV_HOME / ".cache"
 REQUIREMENTS_HASH_FILE = CACHE_DIR / ".requirements_hash"
 VERSION_FILE = CACHE_DIR / ".version_info"
 LAST_CHECK_FILE = CACHE_DIR / ".last_update_check"
+LAST_ATTEMPT_FILE = CACHE_DIR / ".last_update_attempt"
+BACKGROUND_CHECK_LOCK = CACHE_DIR / ".update_check.lock"
+UPDATE_CHECK_CACHE = CACHE_DIR / "update_check.json"
 OBSOLETE_FILES_DB = CACHE_DIR / ".obsolete_files.json"
 UPDATE_LOG = CACHE_DIR / "update.log"
 BACKUP_DIR = CACHE_DIR / ".backup"
 MAIN_GO = SECV_HOME / "main.go"
 SECV_BINARY = SECV_HOME / "secV"
+TOOLS_DIR = SECV_HOME / "tools"
+
+# Tracked components (name -> path) and directories a working install needs
+COMPONENTS_MAP = {
+    "main.go": MAIN_GO,
+    "secV": SECV_BINARY,
+    "install.sh": SECV_HOME / "install.sh",
+    "update.py": SECV_HOME / "update.py",
+    "dashboard.py": SECV_HOME / "dashboard.py",
+    "requirements.txt": SECV_HOME / REQUIREMENTS_FILE,
+}
+CRITICAL_DIRS = (CACHE_DIR, TOOLS_DIR, BACKUP_DIR)
+
+# Components verify requires (label -> COMPONENTS_MAP name)
+CRITICAL_FILES = {
+    "main.go": "main.go",
+    "secV (binary)": "secV",
+    "install.sh": "install.sh",
+    "update.py": "update.py",
+    "requirements.txt": "requirements.txt",
+}
+
+# Files copied into a backup before every update
+BACKUP_FILES = (SECV_BINARY, MAIN_GO, COMPONENTS_MAP["install.sh"], COMPONENTS_MAP["update.py"],
+                COMPONENTS_MAP["requirements.txt"], REQUIREMENTS_HASH_FILE, VERSION_FILE)
+
+# Top-level files that must stay executable
+EXECUTABLE_FILES = (SECV_BINARY, COMPONENTS_MAP["install.sh"])
+
+# fs-verity: _IOWR('f', 134, struct fsverity_digest), SHA-256 algorithm id
+FS_IOC_MEASURE_VERITY = 0xc0046686
+FS_VERITY_HASH_ALG_SHA256 = 1
+
+# Files above this size are hashed via BLAKE3 (multithreaded) or an mmap'd SHA-256;
+# smaller ones with a single buffered read
+LARGE_FILE_SIZE = 64 * 1024
+
+# Threads used to hash components concurrently (one per component at most)
+HASH_WORKERS = min(6, os.cpu_count() or 1)
+
+# get_file_hash results keyed by (path, mtime_ns, size)
+FILE_HASH_CACHE = {}
+
+# Backup directory names: create_backup's "%Y%m%d_%H%M%S" timestamp
+BACKUP_NAME_RE = re.compile(r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})$')
+
+# Maximum paths passed to a single git invocation
+GIT_PATHS_PER_CALL = 256
 
 # Update check interval (in hours)
 UPDATE_CHECK_INTERVAL = 24
 
+# A background check lock older than this (in seconds) is left over from a killed check
+BACKGROUND_CHECK_TIMEOUT = 600
+
 # --- Colors for better output ---
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -40,6 +116,10 @@ BOLD = '\033[1m'
 DIM = '\033[2m'
 NC = '\033[0m'
 
+# No escape codes when output is redirected or NO_COLOR is set (before banners are built)
+if os.environ.get('NO_COLOR') or not (sys.stdout and sys.stdout.isatty()):
+    RED = GREEN = YELLOW = CYAN = BLUE = MAGENTA = BOLD = DIM = NC = ''
+
 # --- Symbols ---
 CHECK = "✓"
 CROSS = "✗"
@@ -48,22 +128,80 @@ WARNING = "⚠"
 GEAR = "⚙"
 INFO = "ℹ"
 
+
+def box_banner(title: str, style: str) -> str:
+    """Render a title inside a double-line box"""
+    return (f"{style}╔{'═' * 67}╗{NC}\n"
+            f"{style}║{title:^67}║{NC}\n"
+            f"{style}╚{'═' * 67}╝{NC}")
+
+
+class LineBuffer:
+    """Collect output lines and emit them with a single write to stdout"""
+    
+    def __init__(self):
+        self.lines = []
+    
+    def add(self, line: str = ""):
+        self.lines.append(line)
+    
+    def flush(self):
+        sys.stdout.write("\n".join(self.lines) + "\n")
+        sys.stdout.flush()
+        self.lines.clear()
+
+
+# --- Banners (built once at import) ---
+BANNER_UPDATE_COMPLETE = box_banner(f"Update Complete! {CHECK} Please Restart SecV", BOLD + GREEN)
+BANNER_STATUS = box_banner("SecV Component Status", BOLD + CYAN)
+BANNER_VERIFY = box_banner("Verifying Installation", BOLD + CYAN)
+BANNER_REPAIR = box_banner("Repairing Installation", BOLD + CYAN)
+BANNER_BACKUPS = box_banner("Available Backups", BOLD + CYAN)
+
+# Fixed tail of the update summary
+UPDATE_PLAN = (f"\n  {DIM}This update will:{NC}\n"
+               f"    {BULLET} Create a backup of critical files\n"
+               f"    {BULLET} Stash any local changes (can be restored)\n"
+               f"    {BULLET} Pull latest changes from repository\n"
+               f"    {BULLET} Recompile Go binary if main.go changed\n"
+               f"    {BULLET} Clean obsolete files\n"
+               f"    {BULLET} Update dependencies if needed\n")
+
 # --- Version Info Structure ---
 VERSION_INFO = {
     "current_version": "2.4.0",
     "last_check": None,
     "last_update": None,
+    # Version found by a background first-run check, applied on the next first run
+    "update_available": None,
     "go_compiled": True,
+    # Go toolchain seen by the last update or repair, shown by --status
+    "go_version": None,
+    # Stored column-wise: row i of every column describes names[i]
     "components": {
-        "main.go": {"version": "2.4.0", "hash": None},
-        "install.sh": {"version": "2.4.0", "hash": None},
-        "update.py": {"version": "4.1.0", "hash": None},
-        "dashboard.py": {"version": "1.0.0", "hash": None},
-        "requirements.txt": {"version": "2.3.0", "hash": None},
-        "secV": {"version": "2.4.0", "hash": None, "type": "binary"}
+        "names": ["main.go", "install.sh", "update.py", "dashboard.py", "requirements.txt", "secV"],
+        "versions": ["2.4.0", "2.4.0", "4.1.0", "1.0.0", "2.3.0", "2.4.0"],
+        "hashes": [None, None, None, None, None, None],
+        "types": ["source", "source", "source", "source", "source", "binary"],
+        # stat fingerprint of the file as it was when its hash was recorded
+        "mtimes": [None, None, None, None, None, None],
+        "sizes": [None, None, None, None, None, None],
+        "inodes": [None, None, None, None, None, None]
     }
 }
 
+# Per-component columns, keyed by the field name used in the old row-wise layout
+COMPONENT_COLUMNS = {
+    "version": "versions", "hash": "hashes", "type": "types",
+    "mtime_ns": "mtimes", "size": "sizes", "inode": "inodes"
+}
+
+# git output that is matched against English strings must not be localized
+GIT_C_LOCALE_ENV = {**os.environ, "LC_ALL": "C"}
+
+# Matches the version entry in a (remote) copy of this file
+REMOTE_VERSION_RE = re.compile(rb'"current_version"\s*:\s*"([^"]+)"')
+
 # --- Obsolete Files Database ---
 OBSOLETE_FILES_MAP = {
     "2.2.0": [
@@ -85,57 +223,120 @@ OBSOLETE_FILES_MAP = {
 class Logger:
     """Simple logger for update operations"""
     
+    # Line-buffered append handle, opened on first use and kept for the process;
+    # the lock serializes the open and writes from repair/backup worker threads
+    _handle = None
+    _lock = threading.Lock()
+    
     @staticmethod
     def log(message: str, level: str = "INFO"):
         """Log message to file"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] [{level}] {message}\n"
         
-        UPDATE_LOG.parent.mkdir(parents=True, exist_ok=True)
-        with open(UPDATE_LOG, 'a') as f:
-            f.write(log_entry)
+        with Logger._lock:
+            if Logger._handle is None:
+                UPDATE_LOG.parent.mkdir(parents=True, exist_ok=True)
+                Logger._handle = open(UPDATE_LOG, 'a', buffering=1)
+            Logger._handle.write(log_entry)
+    
+    @staticmethod
+    def close():
+        """Close the log handle; the next log() reopens it"""
+        with Logger._lock:
+            handle, Logger._handle = Logger._handle, None
+        if handle is not None:
+            handle.close()
     
     @staticmethod
     def clear_old_logs():
-        """Keep only last 100 lines of log"""
-        if UPDATE_LOG.exists():
-            with open(UPDATE_LOG, 'r') as f:
-                lines = f.readlines()
+        """Keep only last 100 lines of log, reading backwards from the end"""
+        Logger.close()
+        try:
+            f = open(UPDATE_LOG, 'r+b')
+        except FileNotFoundError:
+            return
+        
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            if pos == 0:
+                return
+            f.seek(pos - 1)
+            # The newline ending the last line does not start a new one
+            wanted = 101 if f.read(1) == b'\n' else 100
+            
+            newlines = 0
+            while pos > 0 and newlines < wanted:
+                step = min(8192, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                newlines += block.count(b'\n')
+            
+            if newlines < wanted:
+                return
+            
+            # Skip past the surplus newlines at the front of the last block read
+            index = -1
+            for _ in range(newlines - wanted + 1):
+                index = block.index(b'\n', index + 1)
             
-            if len(lines) > 100:
-                with open(UPDATE_LOG, 'w') as f:
-                    f.writelines(lines[-100:])
+            f.seek(pos + index + 1)
+            tail = f.read()
+            f.seek(0)
+            f.write(tail)
+            f.truncate()
+
+
+class GitSnapshot(NamedTuple):
+    """Repository state read by a single `git status` call"""
+    uncommitted: Tuple[str, ...]
+    stash_count: int
 
 
 class GitManager:
     """Manage Git operations with conflict resolution"""
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def snapshot() -> GitSnapshot:
+        """
+        Modified tracked files and stash count from one porcelain v2 status
+        (cached; see clear_state_cache). The "# stash" header needs git >= 2.35;
+        older versions report a stash count of 0.
+        """
+        output = fast_git(['status', '--porcelain=v2', '-z', '--untracked-files=no', '--show-stash'])
+        if output is None:
+            return GitSnapshot((), 0)
+        
+        changed_files = []
+        stash_count = 0
+        entries = iter(output.split('\0'))
+        for entry in entries:
+            # Path follows a fixed number of space-separated header fields per type
+            if entry.startswith('1 '):
+                changed_files.append(entry.split(' ', 8)[8])
+            elif entry.startswith('2 '):
+                changed_files.append(entry.split(' ', 9)[9])
+                next(entries, None)  # rename/copy source path
+            elif entry.startswith('u '):
+                changed_files.append(entry.split(' ', 10)[10])
+            elif entry.startswith('# stash '):
+                stash_count = int(entry[8:])
+        return GitSnapshot(tuple(changed_files), stash_count)
+    
     @staticmethod
     def has_uncommitted_changes() -> Tuple[bool, List[str]]:
-        """Check for uncommitted changes"""
-        try:
-            result = subprocess.run(
-                ['git', 'status', '--porcelain'],
-                cwd=SECV_HOME,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if result.stdout.strip():
-                changed_files = []
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        file = line[3:].strip()
-                        changed_files.append(file)
-                return True, changed_files
-            return False, []
-        except:
-            return False, []
+        """Check for uncommitted changes to tracked files"""
+        uncommitted = GitManager.snapshot().uncommitted
+        return bool(uncommitted), list(uncommitted)
     
     @staticmethod
     def stash_changes() -> bool:
         """Stash uncommitted changes"""
+        import subprocess
+        from datetime import datetime
+        GitManager.clear_state_cache()
         try:
             print(f"{YELLOW}Stashing local changes...{NC}")
             result = subprocess.run(
@@ -156,6 +357,8 @@ class GitManager:
     @staticmethod
     def pop_stash() -> bool:
         """Pop the most recent stash"""
+        import subprocess
+        GitManager.clear_state_cache()
         try:
             print(f"{YELLOW}Restoring local changes...{NC}")
             result = subprocess.run(
@@ -163,7 +366,8 @@ class GitManager:
                 cwd=SECV_HOME,
                 capture_output=True,
                 text=True,
-                check=False
+                check=False,
+                env=GIT_C_LOCALE_ENV
             )
             
             if result.returncode == 0:
@@ -185,28 +389,39 @@ class GitManager:
             return False
     
     @staticmethod
-    def list_stashes() -> List[str]:
-        """List all stashes"""
+    def list_stashes() -> Iterator[str]:
+        """Yield stash entries as git prints them"""
+        import subprocess
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 ['git', 'stash', 'list'],
                 cwd=SECV_HOME,
-                capture_output=True,
-                text=True,
-                check=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
-            return result.stdout.strip().split('\n') if result.stdout.strip() else []
-        except:
-            return []
+        except OSError:
+            return
+        with proc:
+            for line in proc.stdout:
+                yield line.rstrip('\n')
+    
+    @staticmethod
+    def has_stash() -> bool:
+        """Check whether refs/stash exists, without listing the stashes"""
+        return fast_git(['rev-parse', '-q', '--verify', 'refs/stash']) is not None
     
     @staticmethod
     def discard_local_changes(files: List[str]) -> bool:
         """Discard local changes to specific files"""
+        import subprocess
+        GitManager.clear_state_cache()
         try:
             print(f"{YELLOW}Discarding local changes...{NC}")
-            for file in files:
+            # One checkout per chunk of paths, keeping argv well under ARG_MAX
+            for i in range(0, len(files), GIT_PATHS_PER_CALL):
                 subprocess.run(
-                    ['git', 'checkout', '--', file],
+                    ['git', 'checkout', '--', *files[i:i + GIT_PATHS_PER_CALL]],
                     cwd=SECV_HOME,
                     capture_output=True,
                     check=True
@@ -218,9 +433,116 @@ class GitManager:
             Logger.log(f"Git checkout failed: {str(e)}", "ERROR")
             return False
     
+    @staticmethod
+    def clear_state_cache():
+        """Forget cached working-tree and stash state after a git operation changed it"""
+        GitManager.snapshot.cache_clear()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def open_repository():
+        """Open SECV_HOME in-process with libgit2, or None if unavailable"""
+        # Imported here: loading libgit2 through cffi is too slow for --first-run/--status
+        try:
+            import pygit2
+        except ImportError:
+            return None
+        try:
+            return pygit2.Repository(str(SECV_HOME))
+        except pygit2.GitError:
+            return None
+    
+    @staticmethod
+    def fetch():
+        """Fetch origin, in-process when pygit2 is available"""
+        repo = GitManager.open_repository()
+        if repo is not None:
+            import pygit2
+            try:
+                repo.remotes["origin"].fetch()
+                return
+            except (pygit2.GitError, KeyError) as e:
+                Logger.log(f"pygit2 fetch failed, using git CLI: {e}", "WARNING")
+        run_capture(['git', 'fetch'])
+    
+    @staticmethod
+    def remote_matches_head() -> Optional[bool]:
+        """
+        Compare HEAD with the remote tip of the current branch via ls-remote
+        (a ref advertisement only, no pack download).
+        Returns None when it cannot be determined (detached HEAD, network error).
+        """
+        local = run_capture(['git', 'rev-parse', 'HEAD'], check=False)
+        branch = run_capture(['git', 'symbolic-ref', '--short', 'HEAD'], check=False)
+        if local.returncode != 0 or branch.returncode != 0:
+            return None
+        
+        remote = run_capture(
+            ['git', 'ls-remote', 'origin', 'refs/heads/' + branch.stdout.strip()], check=False
+        )
+        if remote.returncode != 0 or not remote.stdout.strip():
+            return None
+        return remote.stdout.split()[0] == local.stdout.strip()
+    
+    @staticmethod
+    def is_behind_remote() -> Optional[bool]:
+        """True if HEAD is behind its upstream, False if up to date, None if unknown"""
+        repo = GitManager.open_repository()
+        if repo is not None:
+            import pygit2
+            try:
+                upstream = GitManager.upstream_branch(repo).target
+                ahead, behind = repo.ahead_behind(repo.head.target, upstream)
+                return GitManager.behind_state(ahead, behind)
+            except (pygit2.GitError, KeyError):
+                pass
+        
+        result = run_capture(['git', 'rev-list', '--left-right', '--count', 'HEAD...@{u}'], check=False)
+        if result.returncode != 0:
+            return None
+        ahead, behind = map(int, result.stdout.split())
+        return GitManager.behind_state(ahead, behind)
+    
+    @staticmethod
+    def behind_state(ahead: int, behind: int) -> Optional[bool]:
+        """
+        is_behind_remote's answer for the given commit counts. Local commits (ahead, or
+        diverged) give None, like the old "git status" check, so no update is offered
+        that could only be applied by a merging pull.
+        """
+        if ahead:
+            return None
+        return behind > 0
+    
+    @staticmethod
+    def read_remote_file(path: str) -> Optional[bytes]:
+        """Read a file's contents at the current branch's upstream (as of the last fetch)"""
+        repo = GitManager.open_repository()
+        if repo is not None:
+            import pygit2
+            try:
+                upstream = GitManager.upstream_branch(repo).name
+                return repo.revparse_single(f"{upstream}:{path}").data
+            except (pygit2.GitError, KeyError):
+                pass
+        
+        return GitBatch.read(f"@{{upstream}}:{path}")
+    
+    @staticmethod
+    def upstream_branch(repo):
+        """
+        The pygit2 remote-tracking branch the current branch follows, i.e. the
+        CLI's @{upstream}. Raises KeyError on a detached HEAD or without an upstream.
+        """
+        upstream = repo.branches.local[repo.head.shorthand].upstream
+        if upstream is None:
+            raise KeyError(f"{repo.head.shorthand} has no upstream")
+        return upstream
+    
     @staticmethod
     def pull_with_rebase() -> Tuple[bool, str]:
         """Pull with rebase strategy"""
+        import subprocess
         try:
             result = subprocess.run(
                 ['git', 'pull', '--rebase'],
@@ -234,75 +556,288 @@ class GitManager:
             return False, e.stderr
 
 
+class GitBatch:
+    """
+    Read git objects through one long-lived `git cat-file --batch` process,
+    shared by every lookup in the run and shut down at interpreter exit.
+    """
+    
+    _process = None
+    _atexit_registered = False
+    
+    @staticmethod
+    def start():
+        """Spawn the cat-file process on first use and return it"""
+        import subprocess
+        process = GitBatch._process
+        if process is None or process.poll() is not None:
+            if not GitBatch._atexit_registered:
+                import atexit
+                atexit.register(GitBatch.close)
+                GitBatch._atexit_registered = True
+            process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                cwd=SECV_HOME,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            GitBatch._process = process
+        return process
+    
+    @staticmethod
+    def read(rev: str) -> Optional[bytes]:
+        """
+        Read the object named by rev (e.g. "@{upstream}:update.py").
+        Returns None if it does not exist or git is unavailable.
+        """
+        try:
+            process = GitBatch.start()
+            process.stdin.write(rev.encode() + b"\n")
+            process.stdin.flush()
+            
+            # "<sha> <type> <size>\n<data>\n" or "<rev> missing\n"
+            header = process.stdout.readline().split()
+            if len(header) != 3:
+                return None
+            size = int(header[2])
+            data = process.stdout.read(size)
+            process.stdout.read(1)
+            return data
+        except (OSError, ValueError):
+            GitBatch.close()
+            return None
+    
+    @staticmethod
+    def close():
+        """Shut down the cat-file process, if running"""
+        process, GitBatch._process = GitBatch._process, None
+        if process is not None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=5)
+            except Exception:
+                process.kill()
+
+
 class VersionManager:
     """Manage version information and tracking"""
     
+    # Parsed VERSION_FILE, keyed by the (mtime_ns, size) it was read at
+    _cache_key = None
+    _cache_info = None
+    
     @staticmethod
     def load_version_info() -> Dict:
-        """Load version info from cache"""
-        if VERSION_FILE.exists():
-            try:
-                with open(VERSION_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return VERSION_INFO.copy()
+        """Load version info from cache (re-parsed only when the file changed)"""
+        try:
+            st = os.stat(VERSION_FILE)
+        except OSError:
+            return copy.deepcopy(VERSION_INFO)
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if VersionManager._cache_key == key:
+            return copy.deepcopy(VersionManager._cache_info)
+        
+        try:
+            with open(VERSION_FILE, 'r') as f:
+                info = json.load(f)
+            info["components"] = VersionManager.normalize_components(info.get("components", {}))
+        except:
+            return copy.deepcopy(VERSION_INFO)
+        
+        VersionManager._cache_key = key
+        VersionManager._cache_info = info
+        return copy.deepcopy(info)
+    
+    @staticmethod
+    def normalize_components(components: Dict) -> Dict:
+        """Convert legacy {name: {field: value}} records to the columnar layout"""
+        if "names" in components:
+            names = components["names"]
+            for column in COMPONENT_COLUMNS.values():
+                values = components.setdefault(column, [])
+                values.extend([None] * (len(names) - len(values)))
+            return components
+        
+        names = list(components)
+        columnar = {"names": names}
+        for field, column in COMPONENT_COLUMNS.items():
+            columnar[column] = [components[name].get(field) for name in names]
+        return columnar
+    
+    @staticmethod
+    def get_component_field(version_info: Dict, component: str, column: str):
+        """Read one column value for a component, or None if it is untracked"""
+        components = version_info["components"]
+        try:
+            return components[column][components["names"].index(component)]
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def set_component_field(version_info: Dict, component: str, column: str, value):
+        """Write one column value for a component, adding a row if needed"""
+        components = version_info["components"]
+        names = components["names"]
+        if component not in names:
+            names.append(component)
+            for other in COMPONENT_COLUMNS.values():
+                components[other].append(None)
+        components[column][names.index(component)] = value
     
     @staticmethod
     def save_version_info(info: Dict):
-        """Save version info to cache"""
+        """Save version info to cache (atomically, via a temp file)"""
         VERSION_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(VERSION_FILE, 'w') as f:
-            json.dump(info, f, indent=2)
+        tmp_file = VERSION_FILE.with_name(VERSION_FILE.name + ".tmp")
+        tmp_file.write_bytes(dump_json(info))
+        os.replace(tmp_file, VERSION_FILE)
+        
+        st = os.stat(VERSION_FILE)
+        VersionManager._cache_key = (st.st_mtime_ns, st.st_size)
+        VersionManager._cache_info = copy.deepcopy(info)
         Logger.log(f"Saved version info: {info['current_version']}")
     
     @staticmethod
-    def update_component_hash(component: str, filepath: Path, version_info: Dict):
-        """Update hash for a specific component"""
-        if filepath.exists():
-            file_hash = get_file_hash(filepath)
-            if component not in version_info["components"]:
-                version_info["components"][component] = {}
-            version_info["components"][component]["hash"] = file_hash
+    def bulk_update_hashes(components: Dict[str, Path], version_info: Dict, rehash: bool = False):
+        """
+        Hash all given (existing) components concurrently and update version_info
+        in memory. Does not persist; call save_version_info once afterwards.
+        Components whose stat fingerprint still matches keep their stored hash
+        unless rehash is set.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        items = list(components.items())
+        
+        def fingerprint(item):
+            # Stat before hashing: if the file changes mid-read, the recorded
+            # fingerprint is the older one and the next check re-hashes it
+            component, path = item
+            st = os.stat(path)
+            stored_hash = VersionManager.get_component_field(version_info, component, "hashes")
+            if not rehash and stored_hash and VersionManager.stat_matches(version_info, component, st):
+                return stored_hash, st
+            return get_file_hash(path), st
+        
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            results = list(executor.map(fingerprint, items))
+        
+        # Apply results on this thread so new component rows are appended in order
+        for (component, _), (file_hash, st) in zip(items, results):
+            VersionManager.set_component_field(version_info, component, "hashes", file_hash)
+            VersionManager.record_stat(version_info, component, st)
+    
+    @staticmethod
+    def record_stat(version_info: Dict, component: str, st: os.stat_result):
+        """Remember the (mtime, size, inode) fingerprint the stored hash belongs to"""
+        VersionManager.set_component_field(version_info, component, "mtimes", st.st_mtime_ns)
+        VersionManager.set_component_field(version_info, component, "sizes", st.st_size)
+        VersionManager.set_component_field(version_info, component, "inodes", st.st_ino)
+    
+    @staticmethod
+    def stat_matches(version_info: Dict, component: str, st: os.stat_result) -> bool:
+        """True if the file's metadata is unchanged since its hash was recorded"""
+        get = VersionManager.get_component_field
+        return (get(version_info, component, "mtimes") == st.st_mtime_ns
+                and get(version_info, component, "sizes") == st.st_size
+                and get(version_info, component, "inodes") == st.st_ino)
     
     @staticmethod
     def check_component_changed(component: str, filepath: Path, version_info: Dict) -> bool:
-        """Check if component file has changed"""
-        if component not in version_info["components"]:
-            return True
-        
-        stored_hash = version_info["components"][component].get("hash")
+        """
+        Check if component file has changed.
+        Only hashes when the stat fingerprint differs; if the content turns out to be
+        identical, the fingerprint in version_info is refreshed (caller saves).
+        """
+        stored_hash = VersionManager.get_component_field(version_info, component, "hashes")
         if not stored_hash:
             return True
         
-        current_hash = get_file_hash(filepath)
-        return current_hash != stored_hash
-    
-    @staticmethod
-    def should_check_updates(force: bool = False) -> bool:
-        """Determine if we should check for updates"""
-        if force:
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
             return True
         
-        if not LAST_CHECK_FILE.exists():
+        if VersionManager.stat_matches(version_info, component, st):
+            return False
+        
+        current_hash = get_file_hash(filepath)
+        if current_hash != stored_hash:
             return True
         
+        VersionManager.record_stat(version_info, component, st)
+        return False
+    
+    @staticmethod
+    def interval_elapsed(marker: Path) -> bool:
+        """Whether UPDATE_CHECK_INTERVAL has passed since marker was last touched"""
         try:
-            with open(LAST_CHECK_FILE, 'r') as f:
-                last_check_str = f.read().strip()
-            
-            last_check_dt = datetime.fromisoformat(last_check_str)
-            next_check = last_check_dt + timedelta(hours=UPDATE_CHECK_INTERVAL)
-            return datetime.now() >= next_check
-        except:
+            last = os.stat(marker).st_mtime
+        except OSError:
             return True
+        return time.time() - last >= UPDATE_CHECK_INTERVAL * 3600
+    
+    @staticmethod
+    def should_check_updates(force: bool = False) -> bool:
+        """Determine if we should check for updates (the marker's mtime is the last check)"""
+        return force or VersionManager.interval_elapsed(LAST_CHECK_FILE)
     
     @staticmethod
     def mark_update_checked():
         """Mark that we've checked for updates"""
         LAST_CHECK_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(LAST_CHECK_FILE, 'w') as f:
-            f.write(datetime.now().isoformat())
+        LAST_CHECK_FILE.touch()
+    
+    @staticmethod
+    def should_attempt_update() -> bool:
+        """Whether a silent first run may apply a pending update (once per interval)"""
+        return VersionManager.interval_elapsed(LAST_ATTEMPT_FILE)
+    
+    @staticmethod
+    def mark_update_attempted():
+        """Record an update attempt; failed and cancelled ones count too"""
+        LAST_ATTEMPT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        LAST_ATTEMPT_FILE.touch()
+    
+    @staticmethod
+    def load_update_cache(current_version: str) -> Optional[Tuple[bool, str, Optional[str]]]:
+        """
+        Result of the last update check, if it is younger than UPDATE_CHECK_INTERVAL
+        and was made for this remote and this installed version.
+        Returns: (has_update, current_version, new_version) or None
+        """
+        try:
+            with open(UPDATE_CHECK_CACHE, 'r') as f:
+                cached = json.load(f)
+            if (cached["remote_url"] != REMOTE_URL
+                    or cached["current_version"] != current_version
+                    or time.time() - cached["checked_at"] >= UPDATE_CHECK_INTERVAL * 3600):
+                return None
+            return cached["has_update"], current_version, cached["new_version"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    @staticmethod
+    def save_update_cache(has_update: bool, current_version: str, new_version: Optional[str]):
+        """Remember an update check's result and mark the check as done"""
+        VersionManager.mark_update_checked()
+        tmp_file = UPDATE_CHECK_CACHE.with_name(UPDATE_CHECK_CACHE.name + ".tmp")
+        tmp_file.write_bytes(dump_json({
+            "remote_url": REMOTE_URL,
+            "checked_at": time.time(),
+            "has_update": has_update,
+            "current_version": current_version,
+            "new_version": new_version,
+        }))
+        os.replace(tmp_file, UPDATE_CHECK_CACHE)
+
+
+class Backup(NamedTuple):
+    """A backup directory; created is its timestamp name formatted for display"""
+    path: Path
+    name: str
+    created: Optional[str]
 
 
 class BackupManager:
@@ -311,17 +846,23 @@ class BackupManager:
     @staticmethod
     def create_backup(files: List[Path]) -> Optional[Path]:
         """Create backup of specified files"""
+        from concurrent.futures import ThreadPoolExecutor
+        from datetime import datetime
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = BACKUP_DIR / timestamp
             backup_path.mkdir(parents=True, exist_ok=True)
             
+            pairs = []
             for file in files:
                 if file.exists():
-                    rel_path = file.relative_to(SECV_HOME)
-                    dest = backup_path / rel_path
+                    dest = backup_path / file.relative_to(SECV_HOME)
                     dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(file, dest)
+                    pairs.append((file, dest))
+            
+            if pairs:
+                with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+                    list(executor.map(BackupManager.copy_file, pairs))
             
             Logger.log(f"Created backup: {backup_path}")
             print(f"{GREEN}{CHECK} Backup created: {backup_path.name}{NC}")
@@ -332,25 +873,52 @@ class BackupManager:
             return None
     
     @staticmethod
-    def list_backups() -> List[Path]:
-        """List available backups"""
-        if not BACKUP_DIR.exists():
+    def copy_file(pair: Tuple[Path, Path]):
+        """Copy one (src, dest) pair, logging before re-raising on failure"""
+        src, dest = pair
+        try:
+            shutil.copy2(src, dest)
+        except OSError as e:
+            Logger.log(f"Backup copy failed for {src}: {str(e)}", "ERROR")
+            raise
+    
+    @staticmethod
+    def list_backups() -> List[Backup]:
+        """List available backups, newest first"""
+        backups = []
+        try:
+            it = os.scandir(BACKUP_DIR)
+        except FileNotFoundError:
             return []
-        return sorted([d for d in BACKUP_DIR.iterdir() if d.is_dir()], reverse=True)
+        with it:
+            for entry in it:
+                # d_type from the scandir itself: no stat, and symlinks are not backups
+                if entry.is_dir(follow_symlinks=False):
+                    # Names are "%Y%m%d_%H%M%S"; reformat by slicing instead of strptime
+                    match = BACKUP_NAME_RE.match(entry.name)
+                    created = "{}-{}-{} {}:{}:{}".format(*match.groups()) if match else None
+                    backups.append(Backup(Path(entry.path), entry.name, created))
+        # Timestamped backups first, newest first; anything else after them
+        backups.sort(key=lambda b: (b.created is not None, b.name), reverse=True)
+        return backups
     
     @staticmethod
     def restore_backup(backup_path: Path) -> bool:
-        """Restore from backup"""
+        """
+        Restore from backup.
+        Files are copied, not hardlinked: editors, git, appends and chmod change
+        files in place, which would silently alter a backup sharing the inode.
+        """
         try:
-            for item in backup_path.rglob("*"):
-                if item.is_file():
-                    rel_path = item.relative_to(backup_path)
-                    dest = SECV_HOME / rel_path
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, dest)
-                    
-                    if dest.suffix == '' and dest.name in ['secV', 'install.sh']:
-                        os.chmod(dest, 0o755)
+            for root, _, filenames in os.walk(backup_path):
+                dest_dir = os.path.join(SECV_HOME, os.path.relpath(root, backup_path))
+                os.makedirs(dest_dir, exist_ok=True)
+                for name in filenames:
+                    BackupManager.copy_into_place(os.path.join(root, name), os.path.join(dest_dir, name))
+            
+            for name in ('secV', 'install.sh'):
+                if (backup_path / name).exists():
+                    os.chmod(SECV_HOME / name, 0o755)
             
             Logger.log(f"Restored backup: {backup_path}")
             print(f"{GREEN}{CHECK} Restored from backup: {backup_path.name}{NC}")
@@ -360,6 +928,14 @@ class BackupManager:
             print(f"{RED}{CROSS} Restore failed: {str(e)}{NC}")
             return False
     
+    @staticmethod
+    def copy_into_place(src: str, dest: str):
+        """Copy src next to dest and rename it over dest, so dest is never missing or partial"""
+        tmp = dest + ".restore-tmp"
+        # copy2 uses sendfile() on Linux
+        shutil.copy2(src, tmp)
+        os.replace(tmp, dest)
+    
     @staticmethod
     def cleanup_old_backups(keep: int = 5):
         """Keep only the most recent backups"""
@@ -367,8 +943,8 @@ class BackupManager:
         if len(backups) > keep:
             for old_backup in backups[keep:]:
                 try:
-                    shutil.rmtree(old_backup)
-                    Logger.log(f"Removed old backup: {old_backup}")
+                    shutil.rmtree(old_backup.path)
+                    Logger.log(f"Removed old backup: {old_backup.path}")
                 except:
                     pass
 
@@ -379,15 +955,17 @@ class GoBinaryManager:
     @staticmethod
     def check_go_available() -> bool:
         """Check if Go is available"""
-        try:
-            result = subprocess.run(['go', 'version'], capture_output=True, timeout=5)
-            return result.returncode == 0
-        except:
-            return False
+        return get_go_version() is not None
+    
+    @staticmethod
+    def go_version() -> Optional[str]:
+        """Installed Go version, probed once per run"""
+        return get_go_version()
     
     @staticmethod
     def compile_binary() -> bool:
         """Compile Go binary"""
+        import subprocess
         if not MAIN_GO.exists():
             print(f"{RED}{CROSS} main.go not found{NC}")
             return False
@@ -397,21 +975,26 @@ class GoBinaryManager:
             return False
         
         print(f"{YELLOW}[*] Compiling Go binary...{NC}")
+        
+        env = GoBinaryManager.build_env()
 
         # Resolve module deps if go.mod exists
         if (SECV_HOME / "go.mod").exists():
             subprocess.run(
                 ['go', 'mod', 'tidy'],
-                cwd=SECV_HOME, capture_output=True, timeout=60
+                cwd=SECV_HOME, capture_output=True, timeout=60, env=env
             )
 
         try:
+            # -buildvcs=false skips stamping git state (a `git status` per build);
+            # -trimpath keeps the binary and its cache entries independent of SECV_HOME
             result = subprocess.run(
-                ['go', 'build', '-ldflags=-s -w', '-o', 'secV', '.'],
+                ['go', 'build', '-trimpath', '-buildvcs=false', '-ldflags=-s -w', '-o', 'secV', '.'],
                 cwd=SECV_HOME,
                 capture_output=True,
                 text=True,
-                timeout=120
+                timeout=120,
+                env=env
             )
             
             if result.returncode == 0:
@@ -434,12 +1017,33 @@ class GoBinaryManager:
             print(f"{RED}{CROSS} Compilation error: {str(e)}{NC}")
             return False
     
+    @staticmethod
+    def build_env() -> Dict[str, str]:
+        """
+        Environment for go commands. Go's own build cache (~/.cache/go-build) is
+        persistent already; only when it has nowhere to live (no HOME, e.g. under
+        some service managers) is it pointed into CACHE_DIR so rebuilds stay incremental.
+        """
+        env = os.environ.copy()
+        if not any(env.get(var) for var in ('GOCACHE', 'XDG_CACHE_HOME', 'HOME')):
+            env['GOCACHE'] = str(CACHE_DIR / 'go-build')
+        return env
+    
     @staticmethod
     def needs_recompilation(version_info: Dict) -> bool:
         """Check if binary needs recompilation"""
-        if not SECV_BINARY.exists():
+        try:
+            binary_st = SECV_BINARY.stat()
+        except FileNotFoundError:
             return True
         
+        # make-style freshness: a non-empty binary newer than its source is current
+        try:
+            if binary_st.st_size > 0 and binary_st.st_mtime_ns >= MAIN_GO.stat().st_mtime_ns:
+                return False
+        except FileNotFoundError:
+            pass
+        
         if VersionManager.check_component_changed("main.go", MAIN_GO, version_info):
             return True
         
@@ -464,64 +1068,173 @@ class ObsoleteFilesCleaner:
     def save_obsolete_db(db: Dict):
         """Save obsolete files database"""
         OBSOLETE_FILES_DB.parent.mkdir(parents=True, exist_ok=True)
-        with open(OBSOLETE_FILES_DB, 'w') as f:
-            json.dump(db, f, indent=2)
+        OBSOLETE_FILES_DB.write_bytes(dump_json(db))
+        ObsoleteFilesCleaner.lookup_obsolete_files.cache_clear()
     
     @staticmethod
-    def find_obsolete_files(current_version: str, new_version: str) -> List[str]:
-        """Find files that should be removed for this upgrade"""
+    def find_obsolete_files(current_version: str, new_version: str) -> Tuple[str, ...]:
+        """
+        Find files that should be removed for this upgrade (versions in (current, new]).
+        The lookup is reused until the obsolete files database changes on disk.
+        """
+        st = stat_or_none(OBSOLETE_FILES_DB)
+        stamp = (st.st_mtime_ns, st.st_size) if st is not None else None
+        return ObsoleteFilesCleaner.lookup_obsolete_files(stamp, current_version, new_version)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def lookup_obsolete_files(stamp: Optional[Tuple[int, int]], current_version: str,
+                              new_version: str) -> Tuple[str, ...]:
+        """Memoized lookup behind find_obsolete_files, keyed by the database's (mtime_ns, size)"""
         db = ObsoleteFilesCleaner.load_obsolete_db()
-        obsolete = []
+        versions = sorted((v for v in db if version_key(v) is not None), key=version_key)
+        keys = [version_key(v) for v in versions]
         
-        for version, files in db.items():
-            if version > current_version and version <= new_version:
-                obsolete.extend(files)
+        # An unparseable bound (e.g. new version "unknown") leaves that side open
+        current, new = version_key(current_version), version_key(new_version)
+        start = bisect.bisect_right(keys, current) if current is not None else 0
+        end = bisect.bisect_right(keys, new) if new is not None else len(keys)
         
-        return obsolete
+        obsolete = []
+        for version in versions[start:end]:
+            obsolete.extend(db[version])
+        return tuple(obsolete)
     
     @staticmethod
-    def clean_obsolete_files(files: List[str]) -> Tuple[int, int]:
+    def clean_obsolete_files(files: Tuple[str, ...]) -> Tuple[int, int]:
         """Remove obsolete files. Returns (removed, failed)"""
+        from concurrent.futures import ThreadPoolExecutor
         removed = 0
         failed = 0
         
-        for file_pattern in files:
+        paths = [SECV_HOME / f for f in files if '*' not in f]
+        wildcards = [f for f in files if '*' in f]
+        if wildcards:
+            paths.extend(ObsoleteFilesCleaner.match_wildcards(wildcards))
+        
+        file_paths, dir_paths = [], []
+        for path in paths:
             try:
-                if '*' in file_pattern:
-                    import glob
-                    matches = glob.glob(str(SECV_HOME / file_pattern))
-                    for match in matches:
-                        path = Path(match)
-                        if path.exists():
-                            if path.is_dir():
-                                shutil.rmtree(path)
-                            else:
-                                path.unlink()
-                            removed += 1
-                            Logger.log(f"Removed obsolete: {path}")
-                else:
-                    path = SECV_HOME / file_pattern
-                    if path.exists():
-                        if path.is_dir():
-                            shutil.rmtree(path)
-                        else:
-                            path.unlink()
-                        removed += 1
-                        Logger.log(f"Removed obsolete: {path}")
-            except Exception as e:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            (dir_paths if stat.S_ISDIR(st.st_mode) else file_paths).append(path)
+        
+        # Anything inside a directory being removed goes with it
+        dir_set = set(dir_paths)
+        dir_paths = [p for p in dir_paths if not dir_set.intersection(p.parents)]
+        file_paths = [p for p in file_paths if not dir_set.intersection(p.parents)]
+        
+        for path in file_paths:
+            if ObsoleteFilesCleaner.remove_path(path):
+                removed += 1
+            else:
                 failed += 1
-                Logger.log(f"Failed to remove {file_pattern}: {str(e)}", "ERROR")
+        
+        # Trees are unlink-bound and independent, so remove them concurrently
+        if dir_paths:
+            with ThreadPoolExecutor(max_workers=min(4, len(dir_paths))) as executor:
+                for ok in executor.map(ObsoleteFilesCleaner.remove_path, dir_paths):
+                    if ok:
+                        removed += 1
+                    else:
+                        failed += 1
         
         return removed, failed
+    
+    @staticmethod
+    def remove_path(path: Path) -> bool:
+        """Remove a file or directory tree, logging the outcome"""
+        try:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+            Logger.log(f"Removed obsolete: {path}")
+            return True
+        except Exception as e:
+            Logger.log(f"Failed to remove {path}: {str(e)}", "ERROR")
+            return False
+    
+    @staticmethod
+    def wildcard_regex(pattern: str) -> str:
+        """Translate a glob-style pattern ('*' within one path segment) to a regex"""
+        segments = []
+        for segment in pattern.split('/'):
+            regex = re.escape(segment).replace(r'\*', '[^/]*')
+            if segment.startswith('*'):
+                # Like glob, a leading wildcard does not match dotfiles
+                regex = r'(?!\.)' + regex
+            segments.append(regex)
+        return '/'.join(segments)
+    
+    @staticmethod
+    def match_wildcards(patterns: List[str]) -> List[Path]:
+        """
+        Expand wildcard patterns (relative to SECV_HOME) with one combined regex
+        and a single walk per literal base directory.
+        A matching directory is returned whole and not descended into.
+        """
+        matcher = re.compile('|'.join(ObsoleteFilesCleaner.wildcard_regex(p) for p in patterns))
+        
+        # Walk from the literal prefix of each pattern, no deeper than it can match
+        bases = {}
+        for pattern in patterns:
+            segments = pattern.split('/')
+            literal = next(i for i, segment in enumerate(segments) if '*' in segment)
+            base = '/'.join(segments[:literal])
+            bases[base] = max(bases.get(base, 0), len(segments))
+        
+        # Dict keeps discovery order and drops repeats from nested bases
+        matches = {}
+        for base, depth in bases.items():
+            for root, dirs, filenames in os.walk(SECV_HOME / base):
+                rel_root = os.path.relpath(root, SECV_HOME).replace(os.sep, '/')
+                prefix = '' if rel_root == '.' else rel_root + '/'
+                
+                for name in list(dirs):
+                    if matcher.fullmatch(prefix + name):
+                        matches[Path(root) / name] = None
+                        dirs.remove(name)
+                for name in filenames:
+                    if matcher.fullmatch(prefix + name):
+                        matches[Path(root) / name] = None
+                
+                if prefix.count('/') + 1 >= depth:
+                    dirs.clear()
+        return list(matches)
+
+
+def dump_json(obj) -> bytes:
+    """Serialize obj as indented JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def prompt(message: str, default: Optional[str]) -> Optional[str]:
+    """
+    Ask a question and return the stripped answer; piped answers are read like typed ones.
+    Returns default only when stdin has no answer (closed, or at EOF as under --background-check).
+    """
+    try:
+        if sys.stdin is None:
+            raise EOFError
+        return input(message).strip()
+    except EOFError:
+        print(default or "")
+        Logger.log(f"No answer on stdin, using default {default!r}")
+        return default
 
 
-def run_command(command: list, capture: bool = True, check: bool = True):
+def run_capture(command: list, capture: bool = True, check: bool = True, text: bool = True):
     """Helper function to run shell commands"""
+    import subprocess
     try:
         return subprocess.run(
             command,
             capture_output=capture,
-            text=True,
+            text=text,
             check=check,
             cwd=SECV_HOME
         )
@@ -537,23 +1250,233 @@ def run_command(command: list, capture: bool = True, check: bool = True):
         return e
 
 
+@functools.lru_cache(maxsize=1)
+def git_executable() -> Optional[str]:
+    """Absolute path of the git binary on PATH"""
+    return shutil.which('git')
+
+
+def fast_git(args: List[str]) -> Optional[str]:
+    """
+    Run a read-only git query and return its stdout, or None if git failed.
+    Spawns git with os.posix_spawn instead of forking the interpreter; commands
+    that need stdin, stderr or a timeout should keep using subprocess.
+    """
+    git = git_executable()
+    if git is None:
+        return None
+    command = [git, '-C', str(SECV_HOME), *args]
+    if not hasattr(os, 'posix_spawn'):
+        import subprocess
+        result = subprocess.run(command, capture_output=True)
+        return result.stdout.decode(errors='replace') if result.returncode == 0 else None
+
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(git, command, os.environ, file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_DUP2, write_fd, 1),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ])
+    except OSError:
+        os.close(read_fd)
+        return None
+    finally:
+        os.close(write_fd)
+
+    chunks = []
+    try:
+        while True:
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+        _, status = os.waitpid(pid, 0)
+
+    # os.waitstatus_to_exitcode is 3.9+; killed by a signal also counts as failure
+    if not (os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0):
+        return None
+    return b"".join(chunks).decode(errors='replace')
+
+
+def get_verity_digest(filepath: Path) -> Optional[str]:
+    """Read the kernel's fs-verity digest, if the file has verity enabled"""
+    if fcntl is None:
+        return None
+    
+    # struct fsverity_digest { __u16 algorithm; __u16 size; __u8 digest[]; }
+    buf = bytearray(struct.pack("HH", 0, 64) + bytes(64))
+    try:
+        with open(filepath, "rb") as f:
+            fcntl.ioctl(f.fileno(), FS_IOC_MEASURE_VERITY, buf)
+    except OSError:
+        # ENOTTY/EOPNOTSUPP (fs lacks verity) or ENODATA (not enabled on file)
+        return None
+    
+    algorithm, size = struct.unpack_from("HH", buf)
+    if algorithm != FS_VERITY_HASH_ALG_SHA256:
+        return None
+    return "verity-sha256:" + bytes(buf[4:4 + size]).hex()
+
+
 def get_file_hash(filepath: Path) -> Optional[str]:
-    """Calculate SHA256 hash of a file"""
-    if not filepath.exists():
+    """
+    Hash a file for change detection, memoized on (path, mtime_ns, size).
+    Returns '<algorithm>:<hex>' so digests from different algorithms never compare equal.
+    """
+    st = stat_or_none(filepath)
+    if st is None:
         return None
     
+    key = (str(filepath), st.st_mtime_ns, st.st_size)
+    digest = FILE_HASH_CACHE.get(key)
+    if digest is None:
+        digest = compute_file_hash(filepath, st.st_size)
+        FILE_HASH_CACHE[key] = digest
+    return digest
+
+
+def compute_file_hash(filepath: Path, file_size: int) -> str:
+    """Hash a file's contents (see get_file_hash)"""
+    import hashlib
+    verity_digest = get_verity_digest(filepath)
+    if verity_digest:
+        return verity_digest
+    
+    if blake3 is not None and file_size > LARGE_FILE_SIZE:
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return "b3:" + hasher.update_mmap(filepath).hexdigest()
+    
+    # Small files (requirements.txt, scripts): mapping them costs more than reading
+    if file_size <= LARGE_FILE_SIZE and sys.version_info >= (3, 11):
+        with open(filepath, "rb") as f:
+            return "sha256:" + hashlib.file_digest(f, "sha256").hexdigest()
+    
     sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    fd = os.open(str(filepath), os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        try:
+            if size == 0:
+                raise ValueError("cannot mmap an empty file")
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                sha256_hash.update(mm)
+        except (OSError, ValueError):
+            # Empty files, pipes and other unmappable inputs
+            with os.fdopen(os.dup(fd), "rb") as f:
+                if sys.version_info >= (3, 11):
+                    sha256_hash = hashlib.file_digest(f, "sha256")
+                else:
+                    for byte_block in iter(lambda: f.read(1024 * 1024), b""):
+                        sha256_hash.update(byte_block)
+    finally:
+        os.close(fd)
+    return "sha256:" + sha256_hash.hexdigest()
+
 
+def scan_dir(path: Path) -> Dict[str, os.DirEntry]:
+    """Map entry name -> DirEntry for one directory in a single scandir pass"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
+
+def stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """os.stat that returns None instead of raising for missing/unreadable paths"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class ComponentProbe(NamedTuple):
+    """A component as found in SECV_HOME by probe_all_components"""
+    path: Path
+    present: bool
+    executable: bool
 
+
+@functools.lru_cache(maxsize=1)
+def probe_all_components() -> Dict[str, ComponentProbe]:
+    """
+    Presence and execute bits of every component from one scandir of SECV_HOME
+    (cached for status, verify and repair; see clear_probe_caches)
+    """
+    entries = scan_dir(SECV_HOME)
+    probes = {}
+    for name, path in COMPONENTS_MAP.items():
+        entry = entries.get(path.name)
+        try:
+            mode = entry.stat().st_mode if entry is not None else None
+        except OSError:
+            # A dangling symlink is missing, as Path.exists() reported it
+            mode = None
+        probes[name] = ComponentProbe(path, mode is not None, mode is not None and bool(mode & 0o111))
+    return probes
+
+
+@functools.lru_cache(maxsize=1)
 def check_git_repository() -> bool:
     """Check if this is a git repository"""
     return (SECV_HOME / '.git').is_dir()
 
 
+@functools.lru_cache(maxsize=1)
+def get_go_version() -> Optional[str]:
+    """Installed Go version (e.g. 'go1.22.1'), or None if Go is unavailable"""
+    import subprocess
+    go = shutil.which('go')
+    if go is None:
+        return None
+    
+    # Release toolchains ship GOROOT/VERSION next to bin/go; reading it avoids running go
+    try:
+        with open(Path(os.path.realpath(go)).parent.parent / 'VERSION', 'r') as f:
+            version = f.readline().strip()
+        if version.startswith('go'):
+            return version
+    except OSError:
+        pass
+    
+    try:
+        result = subprocess.run(['go', 'version'], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    parts = result.stdout.split()
+    return parts[2] if len(parts) > 2 else "unknown"
+
+
+@functools.lru_cache(maxsize=1)
+def get_git_remotes() -> str:
+    """Output of 'git remote -v' (empty when none are configured)"""
+    return fast_git(['remote', '-v']) or ""
+
+
+def has_git_remote() -> bool:
+    """Check .git/config for a [remote ...] section; falls back to git if unreadable"""
+    try:
+        config = (SECV_HOME / '.git' / 'config').read_text(errors='ignore')
+    except OSError:
+        return bool(get_git_remotes())
+    return any(line.lstrip().startswith('[remote ') for line in config.splitlines())
+
+
+def clear_probe_caches():
+    """Forget cached Go/git probe results after the installation was changed"""
+    get_go_version.cache_clear()
+    get_git_remotes.cache_clear()
+    check_git_repository.cache_clear()
+    probe_all_components.cache_clear()
+
+
 def ensure_git_remote() -> bool:
     """
     Ensure the git repo exists and has the correct remote.
@@ -563,10 +1486,12 @@ def ensure_git_remote() -> bool:
     if not check_git_repository():
         print(f"{YELLOW}Initialising git repository...{NC}")
         try:
-            run_command(['git', 'init'], capture=True)
-            run_command(['git', 'remote', 'add', 'origin', REMOTE_URL], capture=True)
-            run_command(['git', 'fetch', '--depth=1', 'origin'], capture=True)
-            run_command(['git', 'checkout', '-t', 'origin/main'], check=False)
+            run_capture(['git', 'init'], capture=True)
+            check_git_repository.cache_clear()
+            GitManager.open_repository.cache_clear()
+            run_capture(['git', 'remote', 'add', 'origin', REMOTE_URL], capture=True)
+            run_capture(['git', 'fetch', '--depth=1', 'origin'], capture=True)
+            run_capture(['git', 'checkout', '-t', 'origin/main'], check=False)
             print(f"{GREEN}{CHECK} Repository initialised from {REMOTE_URL}{NC}")
             Logger.log(f"Git repo initialised from {REMOTE_URL}")
             return True
@@ -577,36 +1502,42 @@ def ensure_git_remote() -> bool:
 
     # Already a git repo — check remote
     try:
-        result = run_command(['git', 'remote', 'get-url', 'origin'], check=False)
+        result = run_capture(['git', 'remote', 'get-url', 'origin'], check=False)
         if result.returncode != 0 or not result.stdout.strip():
             print(f"{YELLOW}Adding remote origin → {REMOTE_URL}{NC}")
-            run_command(['git', 'remote', 'add', 'origin', REMOTE_URL])
+            run_capture(['git', 'remote', 'add', 'origin', REMOTE_URL])
         elif REMOTE_URL not in result.stdout:
             # Remote points elsewhere — set it
             print(f"{YELLOW}Updating remote origin → {REMOTE_URL}{NC}")
-            run_command(['git', 'remote', 'set-url', 'origin', REMOTE_URL])
+            run_capture(['git', 'remote', 'set-url', 'origin', REMOTE_URL])
     except Exception as e:
         Logger.log(f"Remote check failed: {e}", "WARNING")
 
     return True
 
 
+@functools.lru_cache(maxsize=1)
 def get_remote_version() -> Optional[str]:
-    """Get version from remote repository"""
+    """Get version from remote repository (as of the last fetch)"""
     try:
-        run_command(['git', 'fetch'], capture=True)
-        
-        result = run_command(['git', 'show', 'origin/main:update.py'], check=False)
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'current_version' in line and '=' in line:
-                    version = line.split('=')[1].strip().strip('"').strip("'")
-                    return version
+        data = GitManager.read_remote_file('update.py')
+        if data:
+            match = REMOTE_VERSION_RE.search(data)
+            if match:
+                return match.group(1).decode()
     except:
         pass
     return None
 
 
+def version_key(version: str) -> Optional[Tuple[int, ...]]:
+    """Numeric sort key for an 'X.Y.Z' version, or None if it is not one"""
+    try:
+        return tuple(int(x) for x in version.split('.'))
+    except (AttributeError, ValueError):
+        return None
+
+
 def compare_versions(v1: str, v2: str) -> int:
     """Compare two version strings. Returns: -1 (v1<v2), 0 (equal), 1 (v1>v2)"""
     try:
@@ -635,9 +1566,14 @@ def check_for_updates(force: bool = False, silent: bool = False) -> Tuple[bool,
     Returns: (has_update, current_version, new_version)
     """
     version_info = VersionManager.load_version_info()
+    current_version = version_info["current_version"]
     
-    if not force and not VersionManager.should_check_updates():
-        return False, version_info["current_version"], None
+    if not force:
+        cached = VersionManager.load_update_cache(current_version)
+        if cached is not None:
+            return cached
+        if not VersionManager.should_check_updates():
+            return False, current_version, None
     
     if not silent:
         print(f"{YELLOW}Checking for updates...{NC}")
@@ -645,22 +1581,26 @@ def check_for_updates(force: bool = False, silent: bool = False) -> Tuple[bool,
     if not ensure_git_remote():
         if not silent:
             print(f"{RED}{CROSS} Cannot set up git remote. Check internet connection.{NC}")
-        return False, version_info["current_version"], None
+        return False, current_version, None
 
     try:
-        run_command(['git', 'fetch'])
+        # Cheap path: nothing new upstream means no fetch at all
+        if GitManager.remote_matches_head():
+            VersionManager.save_update_cache(False, current_version, None)
+            return False, current_version, None
+        
+        GitManager.fetch()
         
-        status_result = run_command(['git', 'status', '-uno'])
+        behind = GitManager.is_behind_remote()
         
-        if "Your branch is up to date" in status_result.stdout:
-            VersionManager.mark_update_checked()
-            return False, version_info["current_version"], None
+        if behind is False:
+            VersionManager.save_update_cache(False, current_version, None)
+            return False, current_version, None
         
-        elif "Your branch is behind" in status_result.stdout:
+        elif behind:
             remote_version = get_remote_version()
-            current_version = version_info["current_version"]
             
-            VersionManager.mark_update_checked()
+            VersionManager.save_update_cache(True, current_version, remote_version)
             
             return True, current_version, remote_version
         
@@ -669,76 +1609,160 @@ def check_for_updates(force: bool = False, silent: bool = False) -> Tuple[bool,
         if not silent:
             print(f"{RED}{CROSS} Failed to check for updates: {str(e)}{NC}")
     
-    return False, version_info["current_version"], None
+    return False, current_version, None
+
+
+# Wheels over sdist builds, no self-update check, never block on a prompt
+PIP_INSTALL_FLAGS = ('--prefer-binary', '--disable-pip-version-check', '--no-input')
+
+
+def pip_install_command(requirements_path: Path) -> List[str]:
+    """Pick the one pip invocation that fits this interpreter's environment"""
+    command = [sys.executable, '-m', 'pip', 'install', *PIP_INSTALL_FLAGS]
+    
+    # Inside a virtualenv pip installs into the env itself; --user is rejected there
+    if sys.prefix != sys.base_prefix:
+        return command + ['-r', str(requirements_path)]
+    
+    command.append('--user')
+    # PEP 668: distro-managed interpreters mark their stdlib dir as externally managed
+    if (Path(sysconfig.get_paths()['stdlib']) / 'EXTERNALLY-MANAGED').exists():
+        command.append('--break-system-packages')
+    return command + ['-r', str(requirements_path)]
+
+
+def pip_needs_install(requirements_path: Path) -> bool:
+    """
+    Ask pip's resolver (dry run) whether anything would be installed.
+    Errs on the side of True when pip is too old for --report or fails.
+    """
+    import subprocess
+    command = pip_install_command(requirements_path)
+    command[command.index('-r'):command.index('-r')] = ['--dry-run', '--quiet', '--report', '-']
+    try:
+        result = subprocess.run(command, check=False, capture_output=True, text=True, cwd=SECV_HOME)
+        if result.returncode != 0:
+            return True
+        return len(json.loads(result.stdout).get('install', [])) > 0
+    except (OSError, ValueError):
+        return True
 
 
 def install_dependencies() -> bool:
     """Install Python dependencies"""
+    import subprocess
     requirements_path = SECV_HOME / REQUIREMENTS_FILE
     
     if not requirements_path.exists():
         print(f"{RED}{CROSS} {REQUIREMENTS_FILE} not found!{NC}")
         return False
     
+    if not pip_needs_install(requirements_path):
+        print(f"{GREEN}{CHECK} All requirements already satisfied{NC}")
+        return True
+    
     print(f"\n{YELLOW}Installing/updating dependencies...{NC}")
     
-    pip_commands = [
-        [sys.executable, '-m', 'pip', 'install', '--user', '-r', str(requirements_path)],
-        [sys.executable, '-m', 'pip', 'install', '--user', '--break-system-packages', '-r', str(requirements_path)],
-        [sys.executable, '-m', 'pip', 'install', '-r', str(requirements_path)],
-        [sys.executable, '-m', 'pip', 'install', '--break-system-packages', '-r', str(requirements_path)],
-    ]
+    pip_command = pip_install_command(requirements_path)
+    try:
+        result = subprocess.run(pip_command, check=False, capture_output=True, text=True, cwd=SECV_HOME)
+        
+        # Marker detection can miss; retry only when pip says that is what went wrong
+        if (result.returncode != 0 and 'externally-managed-environment' in result.stderr
+                and '--break-system-packages' not in pip_command):
+            pip_command.insert(pip_command.index('-r'), '--break-system-packages')
+            result = subprocess.run(pip_command, check=False, capture_output=True, text=True, cwd=SECV_HOME)
+        
+        if result.returncode == 0:
+            print(f"{GREEN}{CHECK} Dependencies installed successfully!{NC}")
+            Logger.log("Dependencies installed successfully")
+            return True
+        needs_root = 'Permission denied' in result.stderr
+        Logger.log(f"pip install failed: {result.stderr.strip()[-500:]}", "ERROR")
+    except Exception as e:
+        needs_root = False
+        Logger.log(f"pip install failed: {str(e)}", "ERROR")
     
-    for i, pip_command in enumerate(pip_commands):
-        print(f"{CYAN}Attempt {i+1}/{len(pip_commands)}...{NC}")
+    if needs_root:
+        print(f"{YELLOW}{WARNING} Attempting installation with sudo...{NC}")
+        sudo_command = ['sudo', sys.executable, '-m', 'pip', 'install', *PIP_INSTALL_FLAGS,
+                        '--break-system-packages', '-r', str(requirements_path)]
         try:
-            result = subprocess.run(pip_command, check=False, capture_output=True, cwd=SECV_HOME)
+            result = subprocess.run(sudo_command, check=False, capture_output=False, cwd=SECV_HOME)
             if result.returncode == 0:
-                print(f"{GREEN}{CHECK} Dependencies installed successfully!{NC}")
-                Logger.log("Dependencies installed successfully")
+                print(f"{GREEN}{CHECK} Dependencies installed with sudo!{NC}")
+                Logger.log("Dependencies installed with sudo")
                 return True
         except Exception:
-            continue
-    
-    print(f"{YELLOW}{WARNING} Attempting installation with sudo...{NC}")
-    sudo_command = ['sudo', sys.executable, '-m', 'pip', 'install', '--break-system-packages', '-r', str(requirements_path)]
-    try:
-        result = subprocess.run(sudo_command, check=False, capture_output=False, cwd=SECV_HOME)
-        if result.returncode == 0:
-            print(f"{GREEN}{CHECK} Dependencies installed with sudo!{NC}")
-            Logger.log("Dependencies installed with sudo")
-            return True
-    except Exception:
-        pass
+            pass
     
     print(f"{RED}{CROSS} Failed to install dependencies{NC}")
     Logger.log("Dependency installation failed", "ERROR")
     return False
 
 
-def sync_tools():
-    """Ensure all module scripts in tools/ are executable."""
-    tools_dir = SECV_HOME / "tools"
-    if not tools_dir.exists():
-        return
+# Directories never descended into when walking tools/
+WALK_PRUNE_DIRS = frozenset({'.git', '__pycache__', 'node_modules'})
+
+
+def walk_files(root: Path, suffixes: Tuple[str, ...]):
+    """
+    Yield DirEntry objects for files under root whose name ends with one of suffixes.
+    One scandir pass per directory; entry types come from d_type, not extra stats.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in WALK_PRUNE_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        yield entry
+        except OSError:
+            continue
+
+
+def fix_tool_permissions() -> Optional[int]:
+    """Make module scripts in tools/ executable. Returns the number fixed (None without tools/)."""
+    if not TOOLS_DIR.exists():
+        return None
     fixed = 0
-    for ext in ("*.py", "*.sh"):
-        for path in tools_dir.rglob(ext):
-            if not os.access(path, os.X_OK):
-                try:
-                    os.chmod(path, path.stat().st_mode | 0o111)
-                    fixed += 1
-                except Exception:
-                    pass
-    if fixed:
-        print(f"{GREEN}{CHECK} Made {fixed} module script(s) executable{NC}")
-    else:
-        print(f"{GREEN}{CHECK} Module scripts already executable{NC}")
+    for entry in walk_files(TOOLS_DIR, (".py", ".sh")):
+        try:
+            mode = entry.stat().st_mode
+            if mode & 0o111 != 0o111:
+                os.chmod(entry.path, mode | 0o111)
+                fixed += 1
+        except Exception:
+            pass
     Logger.log(f"sync_tools: fixed {fixed} file(s)")
+    return fixed
+
 
+def tool_permissions_message(fixed: int) -> str:
+    """Summary line for fix_tool_permissions"""
+    if fixed:
+        return f"{GREEN}{CHECK} Made {fixed} module script(s) executable{NC}"
+    return f"{GREEN}{CHECK} Module scripts already executable{NC}"
 
-def perform_update(current_version: str, new_version: str) -> bool:
-    """Perform the actual update"""
+
+def sync_tools():
+    """Ensure all module scripts in tools/ are executable."""
+    fixed = fix_tool_permissions()
+    if fixed is not None:
+        print(tool_permissions_message(fixed))
+
+
+def perform_update(current_version: str, new_version: str, already_fetched: bool = False) -> bool:
+    """
+    Perform the actual update.
+    already_fetched: origin was fetched by check_for_updates, so a fast-forward
+    to the upstream branch suffices instead of pulling (and fetching) again.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
     print(f"\n{CYAN}updating {current_version} → {new_version or 'latest'}{NC}\n")
     
     Logger.log(f"Starting update: {current_version} -> {new_version}")
@@ -747,24 +1771,20 @@ def perform_update(current_version: str, new_version: str) -> bool:
     
     # Step 1: Create backup
     print(f"{YELLOW}[1/8] Creating backup...{NC}")
-    critical_files = [
-        SECV_BINARY,
-        MAIN_GO,
-        SECV_HOME / "install.sh",
-        SECV_HOME / "update.py",
-        SECV_HOME / "requirements.txt",
-        CACHE_DIR / ".requirements_hash",
-        VERSION_FILE
-    ]
+    # `git status` is read-only and independent of the backup copy, so run it alongside
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        status_future = executor.submit(GitManager.has_uncommitted_changes)
+        backup_path = BackupManager.create_backup(list(BACKUP_FILES))
+        has_changes, changed_files = status_future.result()
     
-    backup_path = BackupManager.create_backup(critical_files)
     if not backup_path:
         print(f"{RED}{CROSS} Backup failed. Aborting update.{NC}")
         return False
+    # Prune here rather than after success, so aborted updates don't pile up backups
+    BackupManager.cleanup_old_backups(keep=5)
     
     # Step 2: Handle local changes
     print(f"\n{YELLOW}[2/8] Checking for local changes...{NC}")
-    has_changes, changed_files = GitManager.has_uncommitted_changes()
     
     if has_changes:
         print(f"{YELLOW}{WARNING} Found {len(changed_files)} modified file(s):{NC}")
@@ -778,7 +1798,7 @@ def perform_update(current_version: str, new_version: str) -> bool:
         print(f"  {YELLOW}2{NC} - Discard changes (⚠ permanent!)")
         print(f"  {RED}3{NC} - Cancel update")
         
-        choice = input(f"\n{YELLOW}Choose option [1-3]: {NC}").strip()
+        choice = prompt(f"\n{YELLOW}Choose option [1-3]: {NC}", '3')
         
         if choice == '1':
             if not GitManager.stash_changes():
@@ -786,7 +1806,7 @@ def perform_update(current_version: str, new_version: str) -> bool:
                 return False
             stashed_changes = True
         elif choice == '2':
-            confirm = input(f"{RED}Are you sure? This cannot be undone! [yes/NO]: {NC}").strip().lower()
+            confirm = prompt(f"{RED}Are you sure? This cannot be undone! [yes/NO]: {NC}", 'no').lower()
             if confirm == 'yes':
                 if not GitManager.discard_local_changes(changed_files):
                     print(f"{RED}{CROSS} Failed to discard changes. Aborting.{NC}")
@@ -803,14 +1823,20 @@ def perform_update(current_version: str, new_version: str) -> bool:
     # Step 3: Pull updates
     print(f"\n{YELLOW}[3/8] Pulling latest changes...{NC}")
     try:
-        result = run_command(['git', 'pull'], capture=False)
+        # Diverged history can't fast-forward; let pull merge as it always has
+        if not (already_fetched
+                and run_capture(['git', 'merge', '--ff-only', '@{u}'], check=False).returncode == 0):
+            result = run_capture(['git', 'pull'], capture=False)
         print(f"{GREEN}{CHECK} Git pull successful{NC}")
         Logger.log("Git pull successful")
+        # The pull rewrote tracked files; drop digests and status of what was there before
+        FILE_HASH_CACHE.clear()
+        GitManager.clear_state_cache()
     except Exception as e:
         print(f"{RED}{CROSS} Git pull failed: {str(e)}{NC}")
         Logger.log(f"Git pull failed: {str(e)}", "ERROR")
         
-        response = input(f"\n{YELLOW}Restore from backup? [Y/n]: {NC}").strip().lower()
+        response = prompt(f"\n{YELLOW}Restore from backup? [Y/n]: {NC}", 'y').lower()
         if not response or response == 'y':
             BackupManager.restore_backup(backup_path)
             if stashed_changes:
@@ -830,11 +1856,10 @@ def perform_update(current_version: str, new_version: str) -> bool:
     obsolete_files = ObsoleteFilesCleaner.find_obsolete_files(current_version, new_version)
     
     if obsolete_files:
-        print(f"{DIM}Found {len(obsolete_files)} obsolete file(s){NC}")
-        for file in obsolete_files:
-            print(f"  {DIM}{BULLET} {file}{NC}")
+        sys.stdout.write(f"{DIM}Found {len(obsolete_files)} obsolete file(s){NC}\n"
+                         + "".join(f"  {DIM}{BULLET} {file}{NC}\n" for file in obsolete_files))
         
-        response = input(f"\n{YELLOW}Remove obsolete files? [Y/n]: {NC}").strip().lower()
+        response = prompt(f"\n{YELLOW}Remove obsolete files? [Y/n]: {NC}", 'y').lower()
         if not response or response == 'y':
             removed, failed = ObsoleteFilesCleaner.clean_obsolete_files(obsolete_files)
             print(f"{GREEN}{CHECK} Removed {removed} file(s){NC}")
@@ -865,7 +1890,7 @@ def perform_update(current_version: str, new_version: str) -> bool:
     requirements_path = SECV_HOME / REQUIREMENTS_FILE
     old_hash = get_file_hash(requirements_path)
     
-    stored_hash = version_info["components"].get("requirements.txt", {}).get("hash")
+    stored_hash = VersionManager.get_component_field(version_info, "requirements.txt", "hashes")
     
     if old_hash != stored_hash:
         print(f"{CYAN}requirements.txt has changed{NC}")
@@ -879,28 +1904,22 @@ def perform_update(current_version: str, new_version: str) -> bool:
     
     version_info["current_version"] = new_version
     version_info["last_update"] = datetime.now().isoformat()
+    version_info["update_available"] = None
     version_info["go_compiled"] = SECV_BINARY.exists()
+    version_info["go_version"] = GoBinaryManager.go_version()
     
     # Update component hashes
-    components = {
-        "main.go": MAIN_GO,
-        "install.sh": SECV_HOME / "install.sh",
-        "update.py": SECV_HOME / "update.py",
-        "dashboard.py": SECV_HOME / "dashboard.py",
-        "requirements.txt": requirements_path,
-        "secV": SECV_BINARY
-    }
-    
-    for comp_name, comp_path in components.items():
-        VersionManager.update_component_hash(comp_name, comp_path, version_info)
+    VersionManager.bulk_update_hashes(
+        {name: path for name, path in COMPONENTS_MAP.items() if path.exists()},
+        version_info
+    )
     
     VersionManager.save_version_info(version_info)
     print(f"{GREEN}{CHECK} Version info applied{NC}")
     
     # Cleanup
     print(f"\n{YELLOW}Cleaning up...{NC}")
-    BackupManager.cleanup_old_backups(keep=5)
-    Logger.cleanup_old_logs()
+    Logger.clear_old_logs()
     print(f"{GREEN}{CHECK} Cleanup complete{NC}")
     
     Logger.log(f"Update completed successfully: {new_version}")
@@ -909,39 +1928,47 @@ def perform_update(current_version: str, new_version: str) -> bool:
 
 def show_update_summary(current_version: str, new_version: str):
     """Display update summary"""
-    print(f"\n{CYAN}update available: {current_version} → {new_version}{NC}\n")
+    out = LineBuffer()
+    out.add(f"\n{CYAN}update available: {current_version} → {new_version}{NC}\n")
     
-    print(f"  {BOLD}Current Version:{NC} {RED}{current_version}{NC}")
-    print(f"  {BOLD}New Version:{NC}     {GREEN}{new_version}{NC}")
+    out.add(f"  {BOLD}Current Version:{NC} {RED}{current_version}{NC}")
+    out.add(f"  {BOLD}New Version:{NC}     {GREEN}{new_version}{NC}")
     
     # Check for local changes
     has_changes, changed_files = GitManager.has_uncommitted_changes()
     if has_changes:
-        print(f"\n  {YELLOW}{WARNING} You have {len(changed_files)} uncommitted change(s){NC}")
-        print(f"  {DIM}These will be automatically stashed during update{NC}")
+        out.add(f"\n  {YELLOW}{WARNING} You have {len(changed_files)} uncommitted change(s){NC}")
+        out.add(f"  {DIM}These will be automatically stashed during update{NC}")
     
     obsolete_files = ObsoleteFilesCleaner.find_obsolete_files(current_version, new_version)
     if obsolete_files:
-        print(f"\n  {YELLOW}{WARNING} Will clean {len(obsolete_files)} obsolete file(s){NC}")
+        out.add(f"\n  {YELLOW}{WARNING} Will clean {len(obsolete_files)} obsolete file(s){NC}")
     
-    print(f"\n  {DIM}This update will:{NC}")
-    print(f"    {BULLET} Create a backup of critical files")
-    print(f"    {BULLET} Stash any local changes (can be restored)")
-    print(f"    {BULLET} Pull latest changes from repository")
-    print(f"    {BULLET} Recompile Go binary if main.go changed")
-    print(f"    {BULLET} Clean obsolete files")
-    print(f"    {BULLET} Update dependencies if needed")
-    print()
+    out.add(UPDATE_PLAN)
+    out.flush()
 
 
 def first_run_check(silent: bool = True) -> bool:
     """
     Check for updates on first run (called by Go loader)
+    Silent runs never wait on the network: they apply an update found by an earlier
+    background check, or start one in a detached process when a check is due.
     Returns: True if update was performed
     """
     Logger.log("First-run update check initiated")
     
-    has_update, current_version, new_version = check_for_updates(force=False, silent=silent)
+    if silent:
+        version_info = VersionManager.load_version_info()
+        current_version = version_info["current_version"]
+        new_version = version_info.get("update_available")
+        has_update = bool(new_version) and new_version != current_version
+        if not has_update and VersionManager.should_check_updates():
+            start_background_check()
+        if has_update and not VersionManager.should_attempt_update():
+            Logger.log(f"Update to {new_version} was attempted recently, not retrying yet")
+            return False
+    else:
+        has_update, current_version, new_version = check_for_updates(force=False, silent=silent)
     
     if not has_update:
         if not silent:
@@ -949,32 +1976,73 @@ def first_run_check(silent: bool = True) -> bool:
         return False
     
     if not silent:
-        print(f"\n{CYAN}╔═══════════════════════════════════════════════════════════════════╗{NC}")
-        print(f"{CYAN}║          Update Available - v{new_version}                         ║{NC}")
-        print(f"{CYAN}╚═══════════════════════════════════════════════════════════════════╝{NC}\n")
+        print(f"\n{box_banner(f'Update Available - v{new_version}', CYAN)}\n")
         print(f"{YELLOW}An update is available for SecV.{NC}")
         print(f"Current: {RED}{current_version}{NC} → New: {GREEN}{new_version}{NC}\n")
         
-        response = input(f"{YELLOW}Would you like to update now? [Y/n]: {NC}").strip().lower()
-        if response and response != 'y':
+        # Nobody to answer means no update: only an explicit yes or Enter starts one
+        response = prompt(f"{YELLOW}Would you like to update now? [Y/n]: {NC}", None)
+        if response is None or (response and response.lower() != 'y'):
             print(f"{CYAN}Update skipped. Run 'update' command later to update.{NC}")
             return False
     
-    # Perform update
-    success = perform_update(current_version, new_version or "unknown")
+    # Perform update (recorded first, so a failed or cancelled one is not retried every boot)
+    VersionManager.mark_update_attempted()
+    success = perform_update(current_version, new_version or "unknown", already_fetched=True)
     
     if success:
-        print(f"\n{BOLD}{GREEN}╔═══════════════════════════════════════════════════════════════════╗{NC}")
-        print(f"{BOLD}{GREEN}║              Update Complete! {CHECK} Please Restart SecV              ║{NC}")
-        print(f"{BOLD}{GREEN}╚═══════════════════════════════════════════════════════════════════╝{NC}\n")
+        print(f"\n{BANNER_UPDATE_COMPLETE}\n")
         print(f"{YELLOW}Please restart SecV to use the new version.{NC}\n")
         sys.exit(2)
     
     return False
 
 
+def start_background_check():
+    """Run record_update_check in a detached process that outlives this one, unless one is running"""
+    import subprocess
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        os.close(os.open(BACKGROUND_CHECK_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        try:
+            if time.time() - os.stat(BACKGROUND_CHECK_LOCK).st_mtime < BACKGROUND_CHECK_TIMEOUT:
+                return
+        except OSError:
+            pass
+        BACKGROUND_CHECK_LOCK.touch()
+    except OSError as e:
+        Logger.log(f"Could not start background update check: {str(e)}", "WARNING")
+        return
+    try:
+        subprocess.Popen(
+            [sys.executable, str(SECV_HOME / "update.py"), '--background-check'],
+            cwd=SECV_HOME,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except OSError as e:
+        BACKGROUND_CHECK_LOCK.unlink(missing_ok=True)
+        Logger.log(f"Could not start background update check: {str(e)}", "WARNING")
+
+
+def record_update_check():
+    """Check for updates silently and remember an available one for the next first run"""
+    try:
+        has_update, _, new_version = check_for_updates(force=True, silent=True)
+        if has_update:
+            version_info = VersionManager.load_version_info()
+            version_info["update_available"] = new_version or "unknown"
+            VersionManager.save_version_info(version_info)
+    finally:
+        BACKGROUND_CHECK_LOCK.unlink(missing_ok=True)
+
+
 def main():
     """Main update process"""
+    from datetime import datetime, timedelta
     print(f"\n{CYAN}secV update{NC}\n")
     
     Logger.log("Update check initiated")
@@ -999,13 +2067,16 @@ def main():
     
     show_update_summary(current_version, new_version or "unknown")
     
-    response = input(f"{YELLOW}Do you want to update now? [Y/n]: {NC}").strip().lower()
-    if response and response != 'y':
+    response = prompt(f"{YELLOW}Do you want to update now? [Y/n]: {NC}", None)
+    if response is None:
+        print(f"{CYAN}No answer given, update not started.{NC}")
+        sys.exit(0)
+    if response and response.lower() != 'y':
         print(f"{CYAN}Update cancelled by user.{NC}")
         Logger.log("Update cancelled by user")
         sys.exit(0)
     
-    success = perform_update(current_version, new_version or "unknown")
+    success = perform_update(current_version, new_version or "unknown", already_fetched=True)
     
     if success:
         print(f"\n{GREEN}{CHECK} Done — restart SecV to use the new version{NC}\n")
@@ -1015,8 +2086,7 @@ def main():
             print(f"{MAGENTA}{INFO} Backup available at: {backups[0].name}{NC}")
             print(f"{DIM}  Use 'python3 update.py --rollback' to restore if needed{NC}")
         
-        stashes = GitManager.list_stashes()
-        if stashes:
+        if GitManager.has_stash():
             print(f"\n{MAGENTA}{INFO} Your changes are stashed{NC}")
             print(f"{DIM}  Run 'git stash list' to see stashed changes{NC}")
             print(f"{DIM}  Run 'git stash pop' to restore them{NC}")
@@ -1031,171 +2101,162 @@ def main():
 
 def show_component_status():
     """Show status of all SecV components"""
-    print(f"\n{BOLD}{CYAN}╔═══════════════════════════════════════════════════════════════════╗{NC}")
-    print(f"{BOLD}{CYAN}║                    SecV Component Status                          ║{NC}")
-    print(f"{BOLD}{CYAN}╚═══════════════════════════════════════════════════════════════════╝{NC}\n")
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
+    out = LineBuffer()
+    out.add(f"\n{BANNER_STATUS}\n")
     
     version_info = VersionManager.load_version_info()
+    recorded_components = copy.deepcopy(version_info["components"])
+    
+    present = {name: probe.path for name, probe in probe_all_components().items() if probe.present}
+    
+    # The git query and the component checks are independent (and hashing
+    # releases the GIL), so run them all at once and print in order afterwards
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS + 1) as executor:
+        snapshot_future = executor.submit(GitManager.snapshot)
+        changed_flags = dict(zip(present, executor.map(
+            lambda name: VersionManager.check_component_changed(name, present[name], version_info),
+            present
+        )))
+        snapshot = snapshot_future.result()
     
-    print(f"  {BOLD}Current Version:{NC} {GREEN}{version_info['current_version']}{NC}")
-    print(f"  {BOLD}Go Compiled:{NC} {GREEN if version_info.get('go_compiled') else YELLOW}{'Yes' if version_info.get('go_compiled') else 'No'}{NC}")
+    out.add(f"  {BOLD}Current Version:{NC} {GREEN}{version_info['current_version']}{NC}")
+    out.add(f"  {BOLD}Go Compiled:{NC} {GREEN if version_info.get('go_compiled') else YELLOW}{'Yes' if version_info.get('go_compiled') else 'No'}{NC}")
+    if version_info.get("go_version"):
+        out.add(f"  {BOLD}Go Version:{NC} {version_info['go_version']}")
     
     last_update = version_info.get("last_update")
     if last_update:
         try:
             last_update_dt = datetime.fromisoformat(last_update)
-            print(f"  {BOLD}Last Update:{NC} {last_update_dt.strftime('%Y-%m-%d %H:%M:%S')}")
+            out.add(f"  {BOLD}Last Update:{NC} {last_update_dt.strftime('%Y-%m-%d %H:%M:%S')}")
         except:
             pass
     
-    # Check for uncommitted changes
-    has_changes, changed_files = GitManager.has_uncommitted_changes()
-    if has_changes:
-        print(f"  {BOLD}Local Changes:{NC} {YELLOW}{len(changed_files)} file(s) modified{NC}")
-    
-    # Check for stashes
-    stashes = GitManager.list_stashes()
-    if stashes:
-        print(f"  {BOLD}Git Stashes:{NC} {CYAN}{len(stashes)} stash(es) available{NC}")
-    
-    print(f"\n  {BOLD}Components:{NC}")
-    print(f"  {DIM}{'─' * 65}{NC}")
-    
-    components_to_check = {
-        "main.go": MAIN_GO,
-        "secV": SECV_BINARY,
-        "install.sh": SECV_HOME / "install.sh",
-        "update.py": SECV_HOME / "update.py",
-        "dashboard.py": SECV_HOME / "dashboard.py",
-        "requirements.txt": SECV_HOME / REQUIREMENTS_FILE
-    }
+    if snapshot.uncommitted:
+        out.add(f"  {BOLD}Local Changes:{NC} {YELLOW}{len(snapshot.uncommitted)} file(s) modified{NC}")
     
-    for comp_name, comp_path in components_to_check.items():
-        if comp_path.exists():
-            comp_info = version_info["components"].get(comp_name, {})
-            comp_version = comp_info.get("version", "unknown")
-            comp_type = comp_info.get("type", "source")
+    if snapshot.stash_count:
+        out.add(f"  {BOLD}Git Stashes:{NC} {CYAN}{snapshot.stash_count} stash(es) available{NC}")
+    
+    out.add(f"\n  {BOLD}Components:{NC}")
+    out.add(f"  {DIM}{'─' * 65}{NC}")
+    
+    for comp_name, comp_path in COMPONENTS_MAP.items():
+        if comp_name in changed_flags:
+            comp_version = VersionManager.get_component_field(version_info, comp_name, "versions") or "unknown"
+            comp_type = VersionManager.get_component_field(version_info, comp_name, "types") or "source"
             
-            changed = VersionManager.check_component_changed(comp_name, comp_path, version_info)
-            status = f"{YELLOW}[MODIFIED]{NC}" if changed else f"{GREEN}[OK]{NC}"
+            status = f"{YELLOW}[MODIFIED]{NC}" if changed_flags[comp_name] else f"{GREEN}[OK]{NC}"
             
             type_label = f" ({comp_type})" if comp_type == "binary" else ""
-            print(f"    {status} {BOLD}{comp_name:<20}{NC} v{comp_version}{type_label}")
+            out.add(f"    {status} {BOLD}{comp_name:<20}{NC} v{comp_version}{type_label}")
         else:
-            print(f"    {RED}[MISSING]{NC} {BOLD}{comp_name:<20}{NC} {DIM}not found{NC}")
+            out.add(f"    {RED}[MISSING]{NC} {BOLD}{comp_name:<20}{NC} {DIM}not found{NC}")
     
-    print()
+    out.add()
+    out.flush()
+    
+    # Persist any fingerprints refreshed for touched-but-identical files
+    if version_info["components"] != recorded_components:
+        VersionManager.save_version_info(version_info)
 
 
 def verify_installation():
     """Verify SecV installation integrity"""
-    print(f"\n{BOLD}{CYAN}╔═══════════════════════════════════════════════════════════════════╗{NC}")
-    print(f"{BOLD}{CYAN}║                    Verifying Installation                         ║{NC}")
-    print(f"{BOLD}{CYAN}╚═══════════════════════════════════════════════════════════════════╝{NC}\n")
+    # The whole report is emitted with one write once every check has run
+    out = LineBuffer()
+    out.add(f"\n{BANNER_VERIFY}\n")
     
     issues = []
-    
-    print(f"  {BOLD}Checking critical files...{NC}")
-    critical_files = {
-        "main.go": MAIN_GO,
-        "secV (binary)": SECV_BINARY,
-        "install.sh": SECV_HOME / "install.sh",
-        "update.py": SECV_HOME / "update.py",
-        "requirements.txt": SECV_HOME / REQUIREMENTS_FILE
-    }
-    
-    for name, path in critical_files.items():
-        if path.exists():
-            if name == "secV (binary)":
-                if os.access(path, os.X_OK):
-                    print(f"    {GREEN}{CHECK}{NC} {name} (executable)")
+    probes = probe_all_components()
+    
+    out.add(f"  {BOLD}Checking critical files...{NC}")
+    for name, component in CRITICAL_FILES.items():
+        probe = probes[component]
+        if probe.present:
+            if probe.path == SECV_BINARY:
+                if probe.executable:
+                    out.add(f"    {GREEN}{CHECK}{NC} {name} (executable)")
                 else:
-                    print(f"    {YELLOW}{WARNING}{NC} {name} (not executable)")
+                    out.add(f"    {YELLOW}{WARNING}{NC} {name} (not executable)")
                     issues.append(f"{name} not executable")
             else:
-                print(f"    {GREEN}{CHECK}{NC} {name}")
+                out.add(f"    {GREEN}{CHECK}{NC} {name}")
         else:
-            print(f"    {RED}{CROSS}{NC} {name} {DIM}(missing){NC}")
+            out.add(f"    {RED}{CROSS}{NC} {name} {DIM}(missing){NC}")
             issues.append(f"Missing critical file: {name}")
     
-    print(f"\n  {BOLD}Checking directories...{NC}")
+    out.add(f"\n  {BOLD}Checking directories...{NC}")
     critical_dirs = {
-        "tools": SECV_HOME / "tools",
+        "tools": TOOLS_DIR,
         ".cache": CACHE_DIR
     }
     
     for name, path in critical_dirs.items():
-        if path.exists() and path.is_dir():
-            print(f"    {GREEN}{CHECK}{NC} {name}/")
+        if path.is_dir():
+            out.add(f"    {GREEN}{CHECK}{NC} {name}/")
         else:
-            print(f"    {YELLOW}{WARNING}{NC} {name}/ {DIM}(will be created){NC}")
+            out.add(f"    {YELLOW}{WARNING}{NC} {name}/ {DIM}(will be created){NC}")
             path.mkdir(parents=True, exist_ok=True)
     
-    print(f"\n  {BOLD}Checking Python dependencies...{NC}")
+    out.add(f"\n  {BOLD}Checking Python dependencies...{NC}")
     required_packages = ['cmd2', 'rich', 'argcomplete']
     
+    # Resolve each package's import spec on sys.path without executing it
+    from importlib.util import find_spec
+    
     for package in required_packages:
-        try:
-            __import__(package)
-            print(f"    {GREEN}{CHECK}{NC} {package}")
-        except ImportError:
-            print(f"    {RED}{CROSS}{NC} {package} {DIM}(not installed){NC}")
+        if find_spec(package) is not None:
+            out.add(f"    {GREEN}{CHECK}{NC} {package}")
+        else:
+            out.add(f"    {RED}{CROSS}{NC} {package} {DIM}(not installed){NC}")
             issues.append(f"Missing Python package: {package}")
     
-    print(f"\n  {BOLD}Checking Go installation...{NC}")
-    if GoBinaryManager.check_go_available():
-        try:
-            result = subprocess.run(['go', 'version'], capture_output=True, text=True)
-            version = result.stdout.split()[2] if result.returncode == 0 else "unknown"
-            print(f"    {GREEN}{CHECK}{NC} Go compiler ({version})")
-        except:
-            print(f"    {GREEN}{CHECK}{NC} Go compiler (available)")
+    out.add(f"\n  {BOLD}Checking Go installation...{NC}")
+    go_version = GoBinaryManager.go_version()
+    if go_version:
+        out.add(f"    {GREEN}{CHECK}{NC} Go compiler ({go_version})")
     else:
-        print(f"    {YELLOW}{WARNING}{NC} Go compiler not available")
-        print(f"    {DIM}    Binary can't be recompiled without Go{NC}")
+        out.add(f"    {YELLOW}{WARNING}{NC} Go compiler not available")
+        out.add(f"    {DIM}    Binary can't be recompiled without Go{NC}")
     
-    print(f"\n  {BOLD}Checking git repository...{NC}")
+    out.add(f"\n  {BOLD}Checking git repository...{NC}")
     if check_git_repository():
-        print(f"    {GREEN}{CHECK}{NC} Git repository initialized")
+        out.add(f"    {GREEN}{CHECK}{NC} Git repository initialized")
         
         try:
-            result = run_command(['git', 'remote', '-v'], check=False)
-            if result.returncode == 0 and result.stdout:
-                print(f"    {GREEN}{CHECK}{NC} Remote configured")
+            if has_git_remote():
+                out.add(f"    {GREEN}{CHECK}{NC} Remote configured")
             else:
-                print(f"    {YELLOW}{WARNING}{NC} No remote configured")
+                out.add(f"    {YELLOW}{WARNING}{NC} No remote configured")
                 issues.append("Git remote not configured")
         except:
             pass
     else:
-        print(f"    {RED}{CROSS}{NC} Not a git repository")
+        out.add(f"    {RED}{CROSS}{NC} Not a git repository")
         issues.append("Not a git repository - updates disabled")
     
-    print(f"\n  {BOLD}{'─' * 65}{NC}")
+    out.add(f"\n  {BOLD}{'─' * 65}{NC}")
     
     if issues:
-        print(f"\n  {YELLOW}{WARNING} Found {len(issues)} issue(s):{NC}")
+        out.add(f"\n  {YELLOW}{WARNING} Found {len(issues)} issue(s):{NC}")
         for issue in issues:
-            print(f"    {BULLET} {issue}")
-        print(f"\n  {DIM}Run './install.sh' to fix installation issues{NC}\n")
+            out.add(f"    {BULLET} {issue}")
+        out.add(f"\n  {DIM}Run './install.sh' to fix installation issues{NC}\n")
+        out.flush()
         return False
     else:
-        print(f"\n  {GREEN}{CHECK} Installation verified - all checks passed!{NC}\n")
+        out.add(f"\n  {GREEN}{CHECK} Installation verified - all checks passed!{NC}\n")
+        out.flush()
         return True
 
 
-def repair_installation():
-    """Attempt to repair common installation issues"""
-    print(f"\n{BOLD}{CYAN}╔═══════════════════════════════════════════════════════════════════╗{NC}")
-    print(f"{BOLD}{CYAN}║                    Repairing Installation                         ║{NC}")
-    print(f"{BOLD}{CYAN}╚═══════════════════════════════════════════════════════════════════╝{NC}\n")
-    
-    repaired = []
-    failed = []
-    
-    print(f"{YELLOW}[1/5] Creating missing directories...{NC}")
-    critical_dirs = [CACHE_DIR, SECV_HOME / "tools", BACKUP_DIR]
-    for dir_path in critical_dirs:
+def repair_directories() -> Tuple[List[str], List[str], List[str]]:
+    """Repair step: create missing directories. Returns (output, repaired, failed)"""
+    output, repaired, failed = [], [], []
+    for dir_path in CRITICAL_DIRS:
         try:
             dir_path.mkdir(parents=True, exist_ok=True)
             repaired.append(f"Created directory: {dir_path.name}")
@@ -1203,53 +2264,62 @@ def repair_installation():
             failed.append(f"Failed to create {dir_path.name}: {str(e)}")
     
     if repaired:
-        print(f"{GREEN}{CHECK} Created {len(repaired)} directories{NC}")
-    
-    print(f"\n{YELLOW}[2/5] Checking version information...{NC}")
+        output.append(f"{GREEN}{CHECK} Created {len(repaired)} directories{NC}")
+    return output, repaired, failed
+
+
+def repair_version_info(probes: Dict[str, ComponentProbe]) -> Tuple[List[str], List[str], List[str]]:
+    """Repair step: re-hash components and rewrite version info. Returns (output, repaired, failed)"""
     version_info = VersionManager.load_version_info()
     
-    components = {
-        "main.go": MAIN_GO,
-        "secV": SECV_BINARY,
-        "install.sh": SECV_HOME / "install.sh",
-        "update.py": SECV_HOME / "update.py",
-        "dashboard.py": SECV_HOME / "dashboard.py",
-        "requirements.txt": SECV_HOME / REQUIREMENTS_FILE
-    }
-    
-    for comp_name, comp_path in components.items():
-        if comp_path.exists():
-            VersionManager.update_component_hash(comp_name, comp_path, version_info)
+    # Repair distrusts the stored fingerprints, so every component is re-read
+    VersionManager.bulk_update_hashes(
+        {name: probe.path for name, probe in probes.items() if probe.present},
+        version_info,
+        rehash=True
+    )
     
-    version_info["go_compiled"] = SECV_BINARY.exists() and os.access(SECV_BINARY, os.X_OK)
+    version_info["go_compiled"] = probes["secV"].executable
+    version_info["go_version"] = GoBinaryManager.go_version()
     VersionManager.save_version_info(version_info)
-    repaired.append("Version information refreshed")
-    print(f"{GREEN}{CHECK} Version info applied{NC}")
-    
-    print(f"\n{YELLOW}[3/5] Checking file permissions...{NC}")
-    executable_files = [SECV_BINARY, SECV_HOME / "install.sh"]
-    
-    for file in executable_files:
-        if file.exists():
+    return [f"{GREEN}{CHECK} Version info applied{NC}"], ["Version information refreshed"], []
+
+
+def repair_permissions() -> Tuple[List[str], List[str], List[str]]:
+    """Repair step: reset modes of the top-level executables. Returns (output, repaired, failed)"""
+    repaired, failed = [], []
+    for file in EXECUTABLE_FILES:
+        file_st = stat_or_none(file)
+        if file_st is not None and stat.S_IMODE(file_st.st_mode) != 0o755:
             try:
                 os.chmod(file, 0o755)
                 repaired.append(f"Fixed permissions: {file.name}")
             except Exception as e:
                 failed.append(f"Failed to fix permissions on {file.name}: {str(e)}")
     
-    print(f"{GREEN}{CHECK} Permissions checked{NC}")
-    
-    print(f"\n{YELLOW}[4/5] Syncing tool permissions...{NC}")
-    sync_tools()
+    return [f"{GREEN}{CHECK} Permissions checked{NC}"], repaired, failed
+
 
-    print(f"\n{YELLOW}[5/5] Checking Go binary...{NC}")
-    if MAIN_GO.exists() and not SECV_BINARY.exists():
+def repair_tool_permissions() -> Tuple[List[str], List[str], List[str]]:
+    """Repair step: make module scripts executable. Returns (output, repaired, failed)"""
+    fixed = fix_tool_permissions()
+    return ([tool_permissions_message(fixed)] if fixed is not None else []), [], []
+
+
+def repair_binary(probes: Dict[str, ComponentProbe]) -> Tuple[List[str], List[str]]:
+    """Repair step: compile or chmod the Go binary (runs alone, prints directly). Returns (repaired, failed)"""
+    repaired, failed = [], []
+    binary_st = stat_or_none(SECV_BINARY)
+    binary_exists = binary_st is not None
+    binary_executable = binary_exists and bool(binary_st.st_mode & 0o111)
+    
+    if probes["main.go"].present and not binary_exists:
         print(f"{CYAN}Binary missing, attempting compilation...{NC}")
         if GoBinaryManager.compile_binary():
             repaired.append("Compiled Go binary")
         else:
             failed.append("Failed to compile Go binary")
-    elif SECV_BINARY.exists() and not os.access(SECV_BINARY, os.X_OK):
+    elif binary_exists and not binary_executable:
         print(f"{CYAN}Binary exists but not executable, fixing...{NC}")
         try:
             os.chmod(SECV_BINARY, 0o755)
@@ -1259,24 +2329,74 @@ def repair_installation():
             failed.append(f"Failed to make binary executable: {str(e)}")
     else:
         print(f"{GREEN}{CHECK} Binary OK{NC}")
+    return repaired, failed
+
+
+def run_independent_repair_steps(probes: Dict[str, ComponentProbe]) -> list:
+    """Run the repair steps that share no data on worker threads, concurrently"""
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(repair_directories),
+            executor.submit(repair_version_info, probes),
+            executor.submit(repair_permissions),
+            executor.submit(repair_tool_permissions),
+        ]
+        return [future.result() for future in futures]
+
+
+def repair_installation():
+    """Attempt to repair common installation issues"""
+    print(f"\n{BANNER_REPAIR}\n")
     
-    print(f"\n{BOLD}{'─' * 67}{NC}")
-    print(f"\n{BOLD}Repair Summary:{NC}")
-    print(f"  {GREEN}{CHECK} Repaired: {len(repaired)}{NC}")
+    repaired = []
+    failed = []
+    probes = probe_all_components()
+    
+    # Steps 1-4 are independent I/O; their output is printed in order once all finish
+    titles = [
+        "[1/5] Creating missing directories...",
+        "[2/5] Checking version information...",
+        "[3/5] Checking file permissions...",
+        "[4/5] Syncing tool permissions...",
+    ]
+    results = run_independent_repair_steps(probes)
+    out = LineBuffer()
+    for i, (title, (output, step_repaired, step_failed)) in enumerate(zip(titles, results)):
+        if i:
+            out.add()
+        out.add(f"{YELLOW}{title}{NC}")
+        out.lines.extend(output)
+        repaired.extend(step_repaired)
+        failed.extend(step_failed)
+    
+    # Step 5 may rewrite secV, which step 2 hashes and step 3 chmods, so it runs last
+    out.add(f"\n{YELLOW}[5/5] Checking Go binary...{NC}")
+    out.flush()
+    step_repaired, step_failed = repair_binary(probes)
+    repaired.extend(step_repaired)
+    failed.extend(step_failed)
+    
+    clear_probe_caches()
+    
+    out.add(f"\n{BOLD}{'─' * 67}{NC}")
+    out.add(f"\n{BOLD}Repair Summary:{NC}")
+    out.add(f"  {GREEN}{CHECK} Repaired: {len(repaired)}{NC}")
     if failed:
-        print(f"  {RED}{CROSS} Failed: {len(failed)}{NC}")
+        out.add(f"  {RED}{CROSS} Failed: {len(failed)}{NC}")
     
     if repaired:
-        print(f"\n{DIM}Repaired items:{NC}")
+        out.add(f"\n{DIM}Repaired items:{NC}")
         for item in repaired[:5]:
-            print(f"    {BULLET} {item}")
+            out.add(f"    {BULLET} {item}")
     
     if failed:
-        print(f"\n{YELLOW}Failed items:{NC}")
+        out.add(f"\n{YELLOW}Failed items:{NC}")
         for item in failed:
-            print(f"    {BULLET} {item}")
+            out.add(f"    {BULLET} {item}")
     
-    print()
+    out.add()
+    out.flush()
     
     return len(failed) == 0
 
@@ -1289,17 +2409,16 @@ def handle_rollback():
         print(f"{YELLOW}{WARNING} No backups available{NC}")
         return
     
-    print(f"\n{BOLD}{CYAN}╔═══════════════════════════════════════════════════════════════════╗{NC}")
-    print(f"{BOLD}{CYAN}║                    Available Backups                              ║{NC}")
-    print(f"{BOLD}{CYAN}╚═══════════════════════════════════════════════════════════════════╝{NC}\n")
+    out = LineBuffer()
+    out.add(f"\n{BANNER_BACKUPS}\n")
     
     for i, backup in enumerate(backups, 1):
-        backup_time = datetime.strptime(backup.name, "%Y%m%d_%H%M%S")
-        print(f"  {i}. {backup.name} ({backup_time.strftime('%Y-%m-%d %H:%M:%S')})")
+        out.add(f"  {i}. {backup.name} ({backup.created or 'unknown time'})")
     
-    print()
+    out.add()
+    out.flush()
     try:
-        choice = input(f"{YELLOW}Select backup to restore (1-{len(backups)}) or 'q' to quit: {NC}").strip()
+        choice = prompt(f"{YELLOW}Select backup to restore (1-{len(backups)}) or 'q' to quit: {NC}", 'q')
         
         if choice.lower() == 'q':
             print(f"{CYAN}Rollback cancelled{NC}")
@@ -1307,10 +2426,10 @@ def handle_rollback():
         
         idx = int(choice) - 1
         if 0 <= idx < len(backups):
-            backup_path = backups[idx]
+            backup_path = backups[idx].path
             print(f"\n{YELLOW}Restoring backup: {backup_path.name}{NC}")
             
-            confirm = input(f"{RED}This will overwrite current files. Continue? [y/N]: {NC}").strip().lower()
+            confirm = prompt(f"{RED}This will overwrite current files. Continue? [y/N]: {NC}", 'n').lower()
             if confirm == 'y':
                 if BackupManager.restore_backup(backup_path):
                     print(f"\n{GREEN}{CHECK} Rollback successful!{NC}")
@@ -1326,6 +2445,19 @@ def handle_rollback():
 
 
 if __name__ == '__main__':
+    # subprocess, hashlib, datetime and concurrent.futures are imported inside the
+    # functions that need them so the Go loader's --first-run path stays cheap
+    if sys.argv[1:] == ['--first-run']:
+        # Called on every SecV boot: skip building the argparse parser entirely
+        try:
+            first_run_check(silent=True)
+        except KeyboardInterrupt:
+            sys.exit(130)
+        except Exception as e:
+            Logger.log(f"Unexpected error: {str(e)}", "ERROR")
+            sys.exit(1)
+        sys.exit(0)
+
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -1364,12 +2496,16 @@ Examples:
                        help='Repair common installation issues')
     parser.add_argument('--sync-tools', action='store_true',
                        help='Make all module scripts in tools/ executable')
+    parser.add_argument('--background-check', action='store_true',
+                       help=argparse.SUPPRESS)
     
     args = parser.parse_args()
     
     try:
         if args.first_run:
             first_run_check(silent=True)
+        elif args.background_check:
+            record_update_check()
         elif args.sync_tools:
             sync_tools()
         elif args.status:
@@ -1385,15 +2521,16 @@ Examples:
             if backups:
                 print(f"\n{BOLD}Available Backups:{NC}")
                 for backup in backups:
-                    backup_time = datetime.strptime(backup.name, "%Y%m%d_%H%M%S")
-                    print(f"  {BULLET} {backup.name} ({backup_time.strftime('%Y-%m-%d %H:%M:%S')})")
+                    print(f"  {BULLET} {backup.name} ({backup.created or 'unknown time'})")
                 print()
             else:
                 print(f"{YELLOW}{WARNING} No backups available{NC}")
         elif args.list_stashes:
             stashes = GitManager.list_stashes()
-            if stashes:
+            first = next(stashes, None)
+            if first is not None:
                 print(f"\n{BOLD}Git Stashes:{NC}")
+                print(f"  {BULLET} {first}")
                 for stash in stashes:
                     print(f"  {BULLET} {stash}")
                 print()